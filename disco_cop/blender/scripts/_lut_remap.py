@@ -0,0 +1,66 @@
+"""Per-case palette LUT remaps for the shooter palette-swap enemies.
+
+Every remap branch is a per-channel transform of an 8-bit value, so each
+palette is stored as a (5 cases, 3 channels, 256) uint8 table. Case order
+matches the classification in classify_pixel; remap_sheet_nb applies a
+table to a whole sheet in one fused pass.
+"""
+
+import numpy as np
+from numba import config, njit, prange
+
+# The remap kernel runs inside forked pool workers; TBB (numba's first pick
+# when installed) is not fork-safe and hangs the parent at exit.
+config.THREADING_LAYER = "workqueue"
+
+CASE_LIGHT, CASE_MID, CASE_WARM, CASE_TONE, CASE_DARK = range(5)
+
+# Every 8-bit channel value, the input axis of a LUT column
+LEVELS = np.arange(256)
+
+
+def lut_column(factor, lo=0, hi=255):
+    """LUT column for int(v * factor) clamped to [lo, hi]."""
+    return np.clip((LEVELS * factor).astype(int), lo, hi)
+
+
+def build_lut(cases):
+    """Stack per-case (r, g, b) columns into a (5, 3, 256) uint8 LUT."""
+    return np.array(cases, dtype=np.uint8)
+
+
+@njit("int64(int64, int64, int64)", cache=True)
+def classify_pixel(r, g, b):
+    """Pick the remap case for an opaque pixel (brightness = (r+g+b)/3)."""
+    total = r + g + b
+    is_gray = abs(r - g) < 20 and abs(g - b) < 20
+    if is_gray and total > 390:
+        return CASE_LIGHT
+    if is_gray and total > 240:
+        return CASE_MID
+    if total > 300 and r > g:
+        return CASE_WARM
+    if total > 150:
+        return CASE_TONE
+    return CASE_DARK
+
+
+# Explicit signature: compiled (or loaded from the on-disk cache) once at
+# import for the C-contiguous uint8 arrays the swap functions pass in.
+@njit("void(uint8[:, :, ::1], uint8[:, :, ::1], uint8[:, :, ::1])", parallel=True, cache=True)
+def remap_sheet_nb(px, out, lut):
+    """Fused per-pixel LUT remap over an (H, W, 4) uint8 sheet; out may alias px."""
+    h, w = px.shape[0], px.shape[1]
+    for y in prange(h):
+        for x in range(w):
+            r, g, b, a = px[y, x, 0], px[y, x, 1], px[y, x, 2], px[y, x, 3]
+            out[y, x, 3] = a
+            if a < 10:
+                out[y, x, 0] = r
+                out[y, x, 1] = g
+                out[y, x, 2] = b
+                continue
+            case = classify_pixel(int(r), int(g), int(b))
+            out[y, x, 0] = lut[case, 0, r]
+            out[y, x, 1] = lut[case, 1, g]
+            out[y, x, 2] = lut[case, 2, b]
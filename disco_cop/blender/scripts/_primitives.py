@@ -0,0 +1,198 @@
+"""Numba raster primitives for pixel-art sprite sheets.
+
+Each primitive writes straight into a (H, W, 4) uint8 array, clipped to its
+bounds, replacing pixels the way ImageDraw does on an RGBA image (no
+blending). ArrayDraw wraps them behind the subset of the ImageDraw.Draw API
+the sheet scripts use, so drawing code can target a NumPy buffer unchanged
+and the sheet is only handed to PIL to be saved.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _put(arr, x, y, rgba):
+    """Write rgba at (x, y) if it lies inside arr."""
+    if 0 <= x < arr.shape[1] and 0 <= y < arr.shape[0]:
+        arr[y, x] = rgba
+
+
+@njit(cache=True)
+def fill_rect(arr, x0, y0, x1, y1, rgba):
+    """Fill the inclusive box [x0, x1] x [y0, y1]."""
+    h, w = arr.shape[0], arr.shape[1]
+    if x0 > x1:
+        x0, x1 = x1, x0
+    if y0 > y1:
+        y0, y1 = y1, y0
+    for y in range(max(y0, 0), min(y1 + 1, h)):
+        for x in range(max(x0, 0), min(x1 + 1, w)):
+            arr[y, x] = rgba
+
+
+@njit(cache=True)
+def outline_rect(arr, x0, y0, x1, y1, rgba):
+    """1px border of the inclusive box [x0, x1] x [y0, y1]."""
+    fill_rect(arr, x0, y0, x1, y0, rgba)
+    fill_rect(arr, x0, y1, x1, y1, rgba)
+    fill_rect(arr, x0, y0, x0, y1, rgba)
+    fill_rect(arr, x1, y0, x1, y1, rgba)
+
+
+@njit(cache=True)
+def draw_line(arr, x0, y0, x1, y1, rgba, width=1):
+    """Bresenham line; wider lines fill the segment's rotated rectangle."""
+    if width <= 1:
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        step_x = 1 if x0 < x1 else -1
+        step_y = 1 if y0 < y1 else -1
+        err = dx + dy
+        x, y = x0, y0
+        while True:
+            _put(arr, x, y, rgba)
+            if x == x1 and y == y1:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x += step_x
+            if e2 <= dx:
+                err += dx
+                y += step_y
+        return
+    vx, vy = float(x1 - x0), float(y1 - y0)
+    length = (vx * vx + vy * vy) ** 0.5
+    if length == 0.0:
+        _put(arr, x0, y0, rgba)
+        return
+    ux, uy = vx / length, vy / length
+    # Normal pointing towards +x/+y, so even widths grow down/right of the
+    # spine the way ImageDraw's do. Band edges are tuned to track its wide
+    # lines closely.
+    nx, ny = -uy, ux
+    if nx + ny < 0.0:
+        nx, ny = -nx, -ny
+    lo, hi = -width / 2.0 + 0.1, width / 2.0 + 0.3
+    pad = width // 2 + 1
+    for y in range(min(y0, y1) - pad, max(y0, y1) + pad + 1):
+        for x in range(min(x0, x1) - pad, max(x0, x1) + pad + 1):
+            px, py = float(x - x0), float(y - y0)
+            along = px * ux + py * uy
+            across = px * nx + py * ny
+            if -0.3 < along < length + 0.3 and lo < across < hi:
+                _put(arr, x, y, rgba)
+
+
+@njit(cache=True)
+def draw_segments(arr, x0s, y0s, x1s, y1s, rgba):
+    """Batch of 1px lines sharing one colour."""
+    for i in range(x0s.size):
+        draw_line(arr, x0s[i], y0s[i], x1s[i], y1s[i], rgba, 1)
+
+
+@njit(cache=True)
+def _in_ellipse(x, y, cx, cy, a, b):
+    if a <= 0.0 or b <= 0.0:
+        return False
+    nx, ny = (x - cx) / a, (y - cy) / b
+    return nx * nx + ny * ny <= 1.0
+
+
+@njit(cache=True)
+def draw_ellipse(arr, x0, y0, x1, y1, fill, outline, has_fill, has_outline, width=1):
+    """Filled and/or outlined ellipse inscribed in the inclusive box."""
+    cx, cy = (x0 + x1) / 2.0, (y0 + y1) / 2.0
+    # Radii padded by 0.4px: the closest fit to ImageDraw's small ellipses
+    a, b = (x1 - x0) / 2.0 + 0.4, (y1 - y0) / 2.0 + 0.4
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
+            if not _in_ellipse(x, y, cx, cy, a, b):
+                continue
+            if has_outline and not _in_ellipse(x, y, cx, cy, a - width, b - width):
+                _put(arr, x, y, outline)
+            elif has_fill:
+                _put(arr, x, y, fill)
+
+
+@njit(cache=True)
+def draw_points(arr, xs, ys, rgba):
+    """Plot (xs[i], ys[i]) in one colour, clipped."""
+    for i in range(xs.size):
+        _put(arr, xs[i], ys[i], rgba)
+
+
+@njit(cache=True)
+def blit_mask(arr, x, y, mask, rgba):
+    """Write rgba wherever mask is non-zero, with mask's top-left at (x, y)."""
+    for my in range(mask.shape[0]):
+        for mx in range(mask.shape[1]):
+            if mask[my, mx]:
+                _put(arr, x + mx, y + my, rgba)
+
+
+@lru_cache(maxsize=1024)
+def as_rgba(color):
+    """ImageDraw-style colour tuple to a read-only uint8 RGBA vector.
+
+    Sheets draw with a small fixed palette, so each colour is converted
+    once and shared by every later call.
+    """
+    if len(color) == 3:
+        color = (*color, 255)
+    rgba = np.array(color, dtype=np.uint8)
+    rgba.flags.writeable = False
+    return rgba
+
+
+def _coords(xy):
+    """Flat int coordinates from [x0, y0, x1, y1, ...] or [(x0, y0), (x1, y1), ...]."""
+    return [int(v) for v in np.asarray(xy).reshape(-1)]
+
+
+def _box(xy):
+    coords = _coords(xy)
+    if len(coords) != 4:
+        raise ValueError(f"expected [x0, y0, x1, y1] or [(x0, y0), (x1, y1)], got {xy!r}")
+    return tuple(coords)
+
+
+class ArrayDraw:
+    """ImageDraw.Draw look-alike that rasterizes into an (H, W, 4) array."""
+
+    _NONE = np.zeros(4, dtype=np.uint8)
+
+    def __init__(self, arr):
+        self.arr = arr
+
+    def point(self, xy, fill):
+        pts = np.asarray(xy, dtype=np.int64).reshape(-1, 2)
+        draw_points(self.arr, pts[:, 0], pts[:, 1], as_rgba(fill))
+
+    def line(self, xy, fill, width=1):
+        """Straight line or polyline through two or more points, like ImageDraw.line."""
+        coords = _coords(xy)
+        if len(coords) < 4 or len(coords) % 2:
+            raise ValueError(f"line needs two or more (x, y) points, got {xy!r}")
+        rgba = as_rgba(fill)
+        for i in range(0, len(coords) - 2, 2):
+            draw_line(self.arr, *coords[i:i + 4], rgba, width)
+
+    def rectangle(self, xy, fill=None, outline=None):
+        x0, y0, x1, y1 = _box(xy)
+        if fill is not None:
+            fill_rect(self.arr, x0, y0, x1, y1, as_rgba(fill))
+        if outline is not None:
+            outline_rect(self.arr, x0, y0, x1, y1, as_rgba(outline))
+
+    def ellipse(self, xy, fill=None, outline=None, width=1):
+        x0, y0, x1, y1 = _box(xy)
+        draw_ellipse(self.arr, x0, y0, x1, y1,
+                     self._NONE if fill is None else as_rgba(fill),
+                     self._NONE if outline is None else as_rgba(outline),
+                     fill is not None, outline is not None, width)
+
+    def bitmap(self, xy, mask, fill):
+        blit_mask(self.arr, int(xy[0]), int(xy[1]), np.asarray(mask), as_rgba(fill))
@@ -0,0 +1,35 @@
+"""Vectorised palette-swap helpers shared by the sprite sheet scripts.
+
+A remap is written as an ordered list of (mask, (r, g, b)) cases over a
+whole (H, W, 4) uint8 sheet, mirroring the scalar if/elif chains the
+remaps were first written as.
+"""
+
+import numpy as np
+
+
+def remap_channels(px):
+    """Split an (H, W, 4) uint8 sheet into the inputs every remap branches on."""
+    r, g, b = (px[..., i].astype(np.int16) for i in range(3))
+    brightness = (r + g + b) / 3.0
+    is_gray = (np.abs(r - g) < 20) & (np.abs(g - b) < 20)
+    return r, g, b, brightness, is_gray
+
+
+def scale(v, factor, lo=0, hi=255):
+    """Vector form of max(min(int(v * factor), hi), lo)."""
+    return np.clip((v * factor).astype(np.int16), lo, hi)
+
+
+def remap_select(px, cases, default):
+    """Apply the first matching (mask, (r, g, b)) case per pixel; alpha < 10 passes through.
+
+    Cases are checked in order like the scalar if/elif chain they replace.
+    """
+    masks = [m for m, _ in cases]
+    out = px.copy()
+    opaque = px[..., 3] >= 10
+    for c in range(3):
+        chan = np.select(masks, [rgb[c] for _, rgb in cases], default[c])
+        out[..., c] = np.where(opaque, chan, px[..., c])
+    return out
@@ -13,90 +13,78 @@ Usage:
     python create_cbgb_enemies.py
 """
 
+import os
 import random
 from pathlib import Path
 
 import numpy as np
 from PIL import Image, ImageDraw
 
+from _lut_remap import LEVELS, build_lut, lut_column, remap_sheet_nb
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 ENEMY_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "enemies"
 
-random.seed(812)
-
-# -- Palette-swap remap functions ----------------------------------------------
-
-
-def remap_bottle_thrower(r, g, b, a):
-    """Shooter -> Bottle Thrower: dark teal shirt, green cargo pants, olive accents."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 130:
-        # Light body -> dark teal shirt
-        return (max(int(r * 0.3), 20), min(int(g * 1.0), 140), min(int(b * 1.2), 150), a)
-    elif is_gray and brightness > 80:
-        # Mid body -> darker green cargo pants
-        return (max(int(r * 0.4), 30), min(int(g * 0.8), 100), max(int(b * 0.4), 40), a)
-    elif brightness > 100 and r > g:
-        # Warm accents -> olive/brown bandana accents
-        return (min(int(r * 0.8), 160), min(int(g * 0.9), 140), max(int(b * 0.4), 40), a)
-    elif brightness > 50:
-        # Mid tones -> teal-tinted skin shadow
-        return (min(int(r * 0.9), 160), min(int(g * 1.0), 155), min(int(b * 0.9), 130), a)
-    else:
-        # Dark (outlines, hair) -> keep dark with teal tint
-        return (r, min(g + 8, 50), min(b + 12, 65), a)
-
-
-def remap_pogo_punk(r, g, b, a):
-    """Shooter -> Pogo Punk: neon yellow/green mohawk, ripped black vest."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 130:
-        # Light body -> neon yellow/green
-        return (min(int(r * 1.2), 230), min(int(g * 1.4), 255), max(int(b * 0.2), 15), a)
-    elif is_gray and brightness > 80:
-        # Mid body -> ripped black vest
-        return (max(int(r * 0.25), 18), max(int(g * 0.25), 18), max(int(b * 0.3), 22), a)
-    elif brightness > 100 and r > g:
-        # Warm accents -> bright orange/yellow skin accents
-        return (min(int(r * 1.4), 255), min(int(g * 1.1), 200), max(int(b * 0.2), 15), a)
-    elif brightness > 50:
-        # Mid tones -> pale punk skin
-        return (min(int(r * 1.1), 200), min(int(g * 1.0), 170), max(int(b * 0.8), 100), a)
-    else:
-        # Dark (outlines) -> keep dark
-        return (r, g, b, a)
+# Fast zlib level while iterating on art; set DISCO_RELEASE_ASSETS=1 to ship.
+PNG_COMPRESS_LEVEL = 9 if os.environ.get("DISCO_RELEASE_ASSETS") else 1
 
+random.seed(812)
 
-def swap_explicit(mappings, remap_fn):
-    """Apply remap function to source sheets with explicit src->dst name mapping.
+# -- Palette-swap remap LUTs --------------------------------------------------
+#
+# One (r, g, b) column triple per case, in _lut_remap's CASE_* order.
+
+# Shooter -> Bottle Thrower: dark teal shirt, green cargo pants, olive accents.
+BOTTLE_THROWER_LUT = build_lut([
+    # Light body -> dark teal shirt
+    (lut_column(0.3, lo=20), lut_column(1.0, hi=140), lut_column(1.2, hi=150)),
+    # Mid body -> darker green cargo pants
+    (lut_column(0.4, lo=30), lut_column(0.8, hi=100), lut_column(0.4, lo=40)),
+    # Warm accents -> olive/brown bandana accents
+    (lut_column(0.8, hi=160), lut_column(0.9, hi=140), lut_column(0.4, lo=40)),
+    # Mid tones -> teal-tinted skin shadow
+    (lut_column(0.9, hi=160), lut_column(1.0, hi=155), lut_column(0.9, hi=130)),
+    # Dark (outlines, hair) -> keep dark with teal tint
+    (LEVELS, np.minimum(LEVELS + 8, 50), np.minimum(LEVELS + 12, 65)),
+])
+
+# Shooter -> Pogo Punk: neon yellow/green mohawk, ripped black vest.
+POGO_PUNK_LUT = build_lut([
+    # Light body -> neon yellow/green
+    (lut_column(1.2, hi=230), lut_column(1.4, hi=255), lut_column(0.2, lo=15)),
+    # Mid body -> ripped black vest
+    (lut_column(0.25, lo=18), lut_column(0.25, lo=18), lut_column(0.3, lo=22)),
+    # Warm accents -> bright orange/yellow skin accents
+    (lut_column(1.4, hi=255), lut_column(1.1, hi=200), lut_column(0.2, lo=15)),
+    # Mid tones -> pale punk skin
+    (lut_column(1.1, hi=200), lut_column(1.0, hi=170), lut_column(0.8, lo=100)),
+    # Dark (outlines) -> keep dark
+    (LEVELS, LEVELS, LEVELS),
+])
+
+
+def swap_explicit(mappings, lut):
+    """Apply a palette LUT to source sheets with explicit src->dst name mapping.
 
     mappings: list of (src_name, dst_name) tuples.
+    lut: (5, 3, 256) uint8 per-case channel table (see build_lut).
     """
     for src_name, dst_name in mappings:
         src_path = ENEMY_DIR / src_name
-        if not src_path.exists():
+        try:
+            img = Image.open(src_path).convert("RGBA")
+        except FileNotFoundError:
             print(f"  [SKIP] {src_name} -- not found")
             continue
 
-        img = Image.open(src_path).convert("RGBA")
         px = np.array(img)
-        h, w, _ = px.shape
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[y, x]
-                px[y, x] = remap_fn(int(r), int(g), int(b), int(a))
+        out = np.empty_like(px)
+        remap_sheet_nb(px, out, lut)
 
         dst_path = ENEMY_DIR / dst_name
-        Image.fromarray(px.astype(np.uint8), "RGBA").save(dst_path)
+        Image.fromarray(out, "RGBA").save(dst_path, "PNG", compress_level=PNG_COMPRESS_LEVEL,
+                                          optimize=False)
         print(f"  [OK] {dst_name}")
 
 
@@ -128,6 +116,13 @@ DIVER_SNEAKER_SOLE = (60, 60, 65)
 DIVER_HAIR = (70, 50, 30)
 DIVER_HAIR_LIGHT = (100, 75, 45)
 DIVER_OUTLINE = (15, 10, 10)
+DIVER_MOTION_LINE = (180, 180, 180, 100)
+
+# Shared overlay colors
+HURT_FLASH = (255, 255, 255, 80)
+SPARK1 = (255, 255, 200, 200)
+SPARK2 = (255, 255, 150, 150)
+CLEAR = (0, 0, 0, 0)
 
 
 # -- Bouncer (30x55) ----------------------------------------------------------
@@ -170,16 +165,18 @@ def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
 
     # -- Head (shaved, thick neck) --
     head_w, head_h = 10, 10
+    head_hw = head_w >> 1
     # Thick neck first (drawn behind head)
     neck_w = 8
+    neck_hw = neck_w >> 1
     if pose != "death" or frame < 3:
-        d.rectangle([cx - neck_w // 2, head_y + head_h - 2, cx + neck_w // 2, torso_y + 1],
+        d.rectangle([cx - neck_hw, head_y + head_h - 2, cx + neck_hw, torso_y + 1],
                     fill=BOUNCER_SKIN, outline=BOUNCER_OUTLINE)
     # Head ellipse
-    d.ellipse([cx - head_w // 2, head_y, cx + head_w // 2, head_y + head_h],
+    d.ellipse([cx - head_hw, head_y, cx + head_hw, head_y + head_h],
               fill=BOUNCER_SKIN, outline=BOUNCER_OUTLINE)
     # Shaved head stubble (close crop on top half)
-    d.arc([cx - head_w // 2, head_y, cx + head_w // 2, head_y + head_h],
+    d.arc([cx - head_hw, head_y, cx + head_hw, head_y + head_h],
           200, 340, fill=BOUNCER_HEAD_STUBBLE, width=2)
     # Brow ridge (tough look)
     d.line([cx - 3, head_y + 4, cx + 3, head_y + 4], fill=BOUNCER_OUTLINE, width=1)
@@ -187,16 +184,17 @@ def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
     d.point([cx - 2, head_y + 5], fill=BOUNCER_OUTLINE)
     d.point([cx + 2, head_y + 5], fill=BOUNCER_OUTLINE)
     # Earpiece (small dot on right side)
-    d.point([cx + head_w // 2 - 1, head_y + 5], fill=BOUNCER_EARPIECE)
-    d.point([cx + head_w // 2, head_y + 5], fill=BOUNCER_EARPIECE_LIGHT)
+    d.point([cx + head_hw - 1, head_y + 5], fill=BOUNCER_EARPIECE)
+    d.point([cx + head_hw, head_y + 5], fill=BOUNCER_EARPIECE_LIGHT)
     # Earpiece wire down neck
     if pose != "death" or frame < 2:
-        d.line([cx + head_w // 2 - 1, head_y + 6, cx + neck_w // 2 - 1, torso_y],
+        d.line([cx + head_hw - 1, head_y + 6, cx + neck_hw - 1, torso_y],
                fill=BOUNCER_EARPIECE, width=1)
 
     # -- Torso (broad black suit jacket) --
     torso_w = 16
-    d.rectangle([cx - torso_w // 2, torso_y, cx + torso_w // 2, hip_y],
+    torso_hw = torso_w >> 1
+    d.rectangle([cx - torso_hw, torso_y, cx + torso_hw, hip_y],
                 fill=BOUNCER_SUIT, outline=BOUNCER_OUTLINE)
     # Suit jacket lapels
     d.line([cx - 2, torso_y, cx - 4, torso_y + 8], fill=BOUNCER_SUIT_LIGHT, width=1)
@@ -212,62 +210,63 @@ def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
     arm_y = torso_y + 2
     arm_len = 14
     if pose == "death" and frame >= 2:
-        d.rectangle([cx - torso_w // 2 - 5, arm_y + 4, cx - torso_w // 2, arm_y + 8],
+        d.rectangle([cx - torso_hw - 5, arm_y + 4, cx - torso_hw, arm_y + 8],
                      fill=BOUNCER_SUIT, outline=BOUNCER_OUTLINE)
-        d.rectangle([cx + torso_w // 2, arm_y + 4, cx + torso_w // 2 + 5, arm_y + 8],
+        d.rectangle([cx + torso_hw, arm_y + 4, cx + torso_hw + 5, arm_y + 8],
                      fill=BOUNCER_SUIT, outline=BOUNCER_OUTLINE)
     else:
         # Left arm (suit sleeve)
         la_end_y = arm_y + arm_len + ao[0]
-        d.line([cx - torso_w // 2, arm_y, cx - torso_w // 2 - 3, la_end_y],
+        d.line([cx - torso_hw, arm_y, cx - torso_hw - 3, la_end_y],
                fill=BOUNCER_SUIT, width=3)
         # Big fist
-        d.rectangle([cx - torso_w // 2 - 5, la_end_y - 2, cx - torso_w // 2 - 1, la_end_y + 2],
+        d.rectangle([cx - torso_hw - 5, la_end_y - 2, cx - torso_hw - 1, la_end_y + 2],
                      fill=BOUNCER_SKIN, outline=BOUNCER_OUTLINE)
         # Right arm
         ra_end_y = arm_y + arm_len + ao[1]
-        d.line([cx + torso_w // 2, arm_y, cx + torso_w // 2 + 3, ra_end_y],
+        d.line([cx + torso_hw, arm_y, cx + torso_hw + 3, ra_end_y],
                fill=BOUNCER_SUIT, width=3)
         # Big fist
-        d.rectangle([cx + torso_w // 2 + 1, ra_end_y - 2, cx + torso_w // 2 + 5, ra_end_y + 2],
+        d.rectangle([cx + torso_hw + 1, ra_end_y - 2, cx + torso_hw + 5, ra_end_y + 2],
                      fill=BOUNCER_SKIN, outline=BOUNCER_OUTLINE)
 
     # -- Legs (suit pants, dress shoes) --
     leg_w = 6
+    leg_hw = leg_w >> 1
     if pose == "death" and frame >= 3:
         d.rectangle([cx - 7, hip_y, cx + 7, hip_y + 4], fill=BOUNCER_SUIT)
     else:
         # Left leg
         ll_x = cx - 5 + lo[0]
-        d.rectangle([ll_x - leg_w // 2, hip_y, ll_x + leg_w // 2, foot_y],
+        d.rectangle([ll_x - leg_hw, hip_y, ll_x + leg_hw, foot_y],
                     fill=BOUNCER_SUIT, outline=BOUNCER_OUTLINE)
         # Right leg
         rl_x = cx + 5 + lo[1]
-        d.rectangle([rl_x - leg_w // 2, hip_y, rl_x + leg_w // 2, foot_y],
+        d.rectangle([rl_x - leg_hw, hip_y, rl_x + leg_hw, foot_y],
                     fill=BOUNCER_SUIT, outline=BOUNCER_OUTLINE)
 
         # Dress shoes
-        d.rectangle([ll_x - leg_w // 2 - 1, foot_y - 2, ll_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([ll_x - leg_hw - 1, foot_y - 2, ll_x + leg_hw + 1, foot_y + 1],
                     fill=BOUNCER_SHOES)
-        d.rectangle([ll_x - leg_w // 2, foot_y, ll_x + leg_w // 2, foot_y + 1],
+        d.rectangle([ll_x - leg_hw, foot_y, ll_x + leg_hw, foot_y + 1],
                     fill=BOUNCER_SHOES_SOLE)
-        d.rectangle([rl_x - leg_w // 2 - 1, foot_y - 2, rl_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([rl_x - leg_hw - 1, foot_y - 2, rl_x + leg_hw + 1, foot_y + 1],
                     fill=BOUNCER_SHOES)
-        d.rectangle([rl_x - leg_w // 2, foot_y, rl_x + leg_w // 2, foot_y + 1],
+        d.rectangle([rl_x - leg_hw, foot_y, rl_x + leg_hw, foot_y + 1],
                     fill=BOUNCER_SHOES_SOLE)
 
     # Hurt flash
     if pose == "hurt":
         d.rectangle([cx - 3, torso_y + 3, cx + 3, torso_y + 8],
-                     fill=(255, 255, 255, 80))
+                     fill=HURT_FLASH)
 
     # Attack: impact spark on punch connect
     if pose == "attack" and frame == 2:
-        fist_x = cx + torso_w // 2 + 6
+        fist_x = cx + torso_hw + 6
         fist_y = arm_y + arm_len + ao[1]
-        d.point([fist_x + 1, fist_y], fill=(255, 255, 200, 200))
-        d.point([fist_x + 2, fist_y - 1], fill=(255, 255, 150, 150))
-        d.point([fist_x + 2, fist_y + 1], fill=(255, 255, 150, 150))
+        d.point([fist_x + 1, fist_y], fill=SPARK1)
+        d.point([fist_x + 2, fist_y - 1], fill=SPARK2)
+        d.point([fist_x + 2, fist_y + 1], fill=SPARK2)
 
 
 def create_bouncer_sheets():
@@ -281,12 +280,16 @@ def create_bouncer_sheets():
         "bouncer_death_sheet.png": ("death", 4),
     }
 
+    # One canvas sized for the longest sheet, cleared and cropped per sheet
+    max_frames = max(nframes for _, nframes in sheets.values())
+    img = Image.new("RGBA", (fw * max_frames, fh), CLEAR)
     for name, (pose, nframes) in sheets.items():
-        img = Image.new("RGBA", (fw * nframes, fh), (0, 0, 0, 0))
+        img.paste(CLEAR, (0, 0, img.width, fh))
         for f in range(nframes):
             draw_bouncer_frame(img, f * fw, 0, fw, fh, pose, f)
         path = ENEMY_DIR / name
-        img.save(path)
+        img.crop((0, 0, fw * nframes, fh)).save(path, "PNG", compress_level=PNG_COMPRESS_LEVEL,
+                                                 optimize=False)
         print(f"  [OK] {name}")
 
 
@@ -358,8 +361,9 @@ def draw_stage_diver_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
 
     # -- Head (ellipse) --
     head_w, head_h = 7, 8
+    head_hw = head_w >> 1
     hcx = cx + head_x_shift
-    d.ellipse([hcx - head_w // 2, head_y, hcx + head_w // 2, head_y + head_h],
+    d.ellipse([hcx - head_hw, head_y, hcx + head_hw, head_y + head_h],
               fill=DIVER_SKIN, outline=DIVER_OUTLINE)
     # Eyes
     d.point([hcx - 2, head_y + 4], fill=DIVER_OUTLINE)
@@ -372,8 +376,9 @@ def draw_stage_diver_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
 
     # -- Torso (shirtless - bare skin upper body) --
     torso_w = 9
+    torso_hw = torso_w >> 1
     tcx = cx + torso_x_shift
-    d.rectangle([tcx - torso_w // 2, torso_y, tcx + torso_w // 2, hip_y],
+    d.rectangle([tcx - torso_hw, torso_y, tcx + torso_hw, hip_y],
                 fill=DIVER_SKIN, outline=DIVER_OUTLINE)
     # Chest definition (subtle shadow lines for lean build)
     d.line([tcx, torso_y + 1, tcx, torso_y + 4], fill=DIVER_SKIN_SHADOW, width=1)
@@ -387,56 +392,57 @@ def draw_stage_diver_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
     arm_y = torso_y + 1
     arm_len = 10
     if pose == "death" and frame >= 2:
-        d.rectangle([tcx - torso_w // 2 - 4, arm_y + 3, tcx - torso_w // 2, arm_y + 6],
+        d.rectangle([tcx - torso_hw - 4, arm_y + 3, tcx - torso_hw, arm_y + 6],
                      fill=DIVER_SKIN, outline=DIVER_OUTLINE)
-        d.rectangle([tcx + torso_w // 2, arm_y + 3, tcx + torso_w // 2 + 4, arm_y + 6],
+        d.rectangle([tcx + torso_hw, arm_y + 3, tcx + torso_hw + 4, arm_y + 6],
                      fill=DIVER_SKIN, outline=DIVER_OUTLINE)
     else:
         # Left arm
         la_end_y = arm_y + arm_len + ao[0]
-        d.line([tcx - torso_w // 2, arm_y, tcx - torso_w // 2 - 2, la_end_y],
+        d.line([tcx - torso_hw, arm_y, tcx - torso_hw - 2, la_end_y],
                fill=DIVER_SKIN, width=2)
-        d.point([tcx - torso_w // 2 - 2, la_end_y], fill=DIVER_SKIN_SHADOW)
+        d.point([tcx - torso_hw - 2, la_end_y], fill=DIVER_SKIN_SHADOW)
         # Right arm
         ra_end_y = arm_y + arm_len + ao[1]
-        d.line([tcx + torso_w // 2, arm_y, tcx + torso_w // 2 + 2, ra_end_y],
+        d.line([tcx + torso_hw, arm_y, tcx + torso_hw + 2, ra_end_y],
                fill=DIVER_SKIN, width=2)
-        d.point([tcx + torso_w // 2 + 2, ra_end_y], fill=DIVER_SKIN_SHADOW)
+        d.point([tcx + torso_hw + 2, ra_end_y], fill=DIVER_SKIN_SHADOW)
 
     # -- Legs (ripped blue jeans) --
     leg_w = 4
+    leg_hw = leg_w >> 1
     if pose == "death" and frame >= 3:
         d.rectangle([cx - 5, hip_y, cx + 5, hip_y + 3], fill=DIVER_JEANS)
     else:
         # Left leg
         ll_x = cx + lo[0]
-        d.rectangle([ll_x - leg_w // 2 - 1, hip_y, ll_x + leg_w // 2, foot_y],
+        d.rectangle([ll_x - leg_hw - 1, hip_y, ll_x + leg_hw, foot_y],
                     fill=DIVER_JEANS, outline=DIVER_OUTLINE)
         # Rip detail (skin showing through)
         rip_y = hip_y + (foot_y - hip_y) // 2
         d.rectangle([ll_x - 1, rip_y, ll_x + 1, rip_y + 2], fill=DIVER_JEANS_RIP)
         # Right leg
         rl_x = cx + lo[1]
-        d.rectangle([rl_x - leg_w // 2, hip_y, rl_x + leg_w // 2 + 1, foot_y],
+        d.rectangle([rl_x - leg_hw, hip_y, rl_x + leg_hw + 1, foot_y],
                     fill=DIVER_JEANS, outline=DIVER_OUTLINE)
         # Rip on right leg too
         rip_y2 = hip_y + (foot_y - hip_y) * 2 // 3
         d.rectangle([rl_x - 1, rip_y2, rl_x + 1, rip_y2 + 1], fill=DIVER_JEANS_RIP)
 
         # Sneakers (white with dark sole)
-        d.rectangle([ll_x - leg_w // 2 - 1, foot_y - 2, ll_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([ll_x - leg_hw - 1, foot_y - 2, ll_x + leg_hw + 1, foot_y + 1],
                     fill=DIVER_SNEAKER)
-        d.rectangle([ll_x - leg_w // 2 - 1, foot_y, ll_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([ll_x - leg_hw - 1, foot_y, ll_x + leg_hw + 1, foot_y + 1],
                     fill=DIVER_SNEAKER_SOLE)
-        d.rectangle([rl_x - leg_w // 2 - 1, foot_y - 2, rl_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([rl_x - leg_hw - 1, foot_y - 2, rl_x + leg_hw + 1, foot_y + 1],
                     fill=DIVER_SNEAKER)
-        d.rectangle([rl_x - leg_w // 2 - 1, foot_y, rl_x + leg_w // 2 + 1, foot_y + 1],
+        d.rectangle([rl_x - leg_hw - 1, foot_y, rl_x + leg_hw + 1, foot_y + 1],
                     fill=DIVER_SNEAKER_SOLE)
 
     # Hurt flash
     if pose == "hurt":
         d.rectangle([cx - 2, torso_y + 2, cx + 2, torso_y + 6],
-                     fill=(255, 255, 255, 80))
+                     fill=HURT_FLASH)
 
     # Charge: motion lines behind diver
     if pose == "charge" and frame >= 1:
@@ -444,7 +450,7 @@ def draw_stage_diver_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
             dx = cx - lean - random.randint(3, 8)
             dy = torso_y + random.randint(-2, 8)
             d.line([dx, dy, dx - random.randint(2, 4), dy],
-                   fill=(180, 180, 180, 100), width=1)
+                   fill=DIVER_MOTION_LINE, width=1)
 
 
 def create_stage_diver_sheets():
@@ -463,7 +469,7 @@ def create_stage_diver_sheets():
         for f in range(nframes):
             draw_stage_diver_frame(img, f * fw, 0, fw, fh, pose, f)
         path = ENEMY_DIR / name
-        img.save(path)
+        img.save(path, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
         print(f"  [OK] {name}")
 
 
@@ -479,7 +485,7 @@ def main():
         ("shooter_shoot_skate_sheet.png", "bottle_thrower_attack_sheet.png"),
         ("shooter_hurt_sheet.png", "bottle_thrower_hurt_sheet.png"),
         ("shooter_death_sheet.png", "bottle_thrower_death_sheet.png"),
-    ], remap_bottle_thrower)
+    ], BOTTLE_THROWER_LUT)
 
     print("\nPogo Punk (palette-swap from shooter):")
     swap_explicit([
@@ -487,7 +493,7 @@ def main():
         ("shooter_shoot_skate_sheet.png", "pogo_punk_attack_sheet.png"),
         ("shooter_hurt_sheet.png", "pogo_punk_hurt_sheet.png"),
         ("shooter_death_sheet.png", "pogo_punk_death_sheet.png"),
-    ], remap_pogo_punk)
+    ], POGO_PUNK_LUT)
 
     print("\nBouncer (from scratch):")
     create_bouncer_sheets()
@@ -28,37 +28,91 @@ Sid Vicious (48x80/frame):
     - sid_vicious_stage_dive_sheet  (288x80, 6f)
     - sid_vicious_berserker_sheet   (288x80, 6f)
 
+  --atlas also packs each boss's sheets into {boss}_atlas.png, one
+  animation per 80px row, with {boss}_atlas.json mapping animation name
+  to x/y/w/h/frames. The game scenes load the per-sheet files.
+
 Usage:
-    python create_concert_boss.py
+    python create_concert_boss.py [--serial] [--atlas]
 """
 
+import argparse
+import io
+import json
 import math
-import random
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
-from PIL import Image, ImageDraw
+from numba import njit
+from PIL import Image
+
+from _primitives import ArrayDraw, as_rgba, draw_points, draw_segments, fill_rect
+from _remap import remap_channels, remap_select, scale
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 BOSS_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "bosses"
 
-random.seed(707)
+# Fast zlib level while iterating on art; set DISCO_RELEASE_ASSETS=1 to ship.
+PNG_COMPRESS_LEVEL = 9 if os.environ.get("DISCO_RELEASE_ASSETS") else 1
 
 FW, FH = 48, 80
 
+
+def save_sheet(arr, path):
+    """Save an (H, W, 4) uint8 sheet, as an indexed PNG when that is lossless.
+
+    Drawn attack sheets use a few dozen RGBA colours, so a palette with
+    per-entry alpha stores them exactly at a quarter of the pixel data;
+    sheets with more than 256 colours stay RGBA. Returns {stem: arr} for
+    the atlas.
+    """
+    colors, index = np.unique(np.ascontiguousarray(arr).view(np.uint32), return_inverse=True)
+    if len(colors) <= 256:
+        img = Image.fromarray(index.reshape(arr.shape[:2]).astype(np.uint8), "P")
+        img.putpalette(colors.view(np.uint8).tobytes(), "RGBA")
+    else:
+        img = Image.fromarray(arr, "RGBA")
+    img.save(path, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    print(f"  [OK] {path.name}")
+    return {path.stem: arr}
+
+
+def sheet_rng(name):
+    """Generator for one sheet, seeded from its name.
+
+    Every sheet owns its random stream, so output doesn't depend on which
+    sheets run first or whether they run in a process pool.
+    """
+    return np.random.default_rng([707, zlib.crc32(name.encode())])
+
+
 # ── Effect colors (shared) ───────────────────────────────────────────────────
 
 SOUND_RING = (180, 160, 255)
 FLAME_YELLOW = (255, 220, 50)
 FLAME_ORANGE = (255, 150, 20)
 FLAME_RED = (255, 60, 10)
+FLAME_RGBA = np.array([(*c, 255) for c in (FLAME_RED, FLAME_ORANGE, FLAME_YELLOW)],
+                      dtype=np.uint8)
+FLAME_EMITTERS = np.array([-15, -8, 0, 8, 15])
 PROJECTILE_GLOW = (255, 200, 100)
 MOTION_BLUR = (100, 60, 160)
 PUNK_GREEN = (60, 200, 60)
 SPIT_GREEN = (120, 220, 40)
 CHAIN_SILVER = (190, 195, 205)
 CHAIN_DARK = (110, 115, 125)
+VIBRATION_BOOST = np.array([30, 20, 50], dtype=np.int16)
+SOLO_BLUR_BOOST = np.array([20, 10, 30], dtype=np.int16)
+RAGE_BOOST = np.array([40, -10, -10], dtype=np.int16)
+RAGE_GLOW_RGBA = np.array([180, 30, 30, 30], dtype=np.uint8)
+SPEED_LINE_RGBA = np.array([*SOUND_RING, 100], dtype=np.uint8)
+SPARK_RGBA = np.array([*PUNK_GREEN, 255], dtype=np.uint8)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -92,49 +146,77 @@ JR_GUITAR_PICKUP = (60, 55, 50)
 JR_GUITAR_GOLD = (210, 180, 60)
 
 
-def remap_johnny_rotten(r, g, b, a):
+def remap_johnny_rotten(px):
     """Disco King → Johnny Rotten: punk green/black, safety pins, sneering."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 160:
+    r, g, b, brightness, is_gray = remap_channels(px)
+    return remap_select(px, [
         # Very light (disco suit highlights) → army green jacket highlight
-        return (max(int(r * 0.3), 45), min(int(g * 0.7), 110), max(int(b * 0.3), 40), a)
-    elif is_gray and brightness > 120:
+        (is_gray & (brightness > 160),
+         (scale(r, 0.3, lo=45), scale(g, 0.7, hi=110), scale(b, 0.3, lo=40))),
         # Light body → ripped black shirt
-        return (max(int(r * 0.3), 35), max(int(g * 0.3), 30), max(int(b * 0.3), 32), a)
-    elif is_gray and brightness > 80:
+        (is_gray & (brightness > 120),
+         (scale(r, 0.3, lo=35), scale(g, 0.3, lo=30), scale(b, 0.3, lo=32))),
         # Mid body → dark green jacket
-        return (max(int(r * 0.3), 30), min(int(g * 0.6), 75), max(int(b * 0.3), 30), a)
-    elif brightness > 120 and r > b:
+        (is_gray & (brightness > 80),
+         (scale(r, 0.3, lo=30), scale(g, 0.6, hi=75), scale(b, 0.3, lo=30))),
         # Warm tones (gold/skin) → pale punk skin
-        return (min(int(r * 0.95), 200), min(int(g * 0.8), 170), min(int(b * 0.75), 150), a)
-    elif brightness > 80 and b > r:
+        ((brightness > 120) & (r > b),
+         (scale(r, 0.95, hi=200), scale(g, 0.8, hi=170), scale(b, 0.75, hi=150))),
         # Cool tones → darker green
-        return (max(int(r * 0.35), 25), min(int(g * 0.8), 100), max(int(b * 0.35), 30), a)
-    elif brightness > 60:
+        ((brightness > 80) & (b > r),
+         (scale(r, 0.35, lo=25), scale(g, 0.8, hi=100), scale(b, 0.35, lo=30))),
         # Mid tones → olive drab
-        return (max(int(r * 0.45), 40), min(int(g * 0.55), 65), max(int(b * 0.35), 28), a)
-    elif brightness > 30:
+        (brightness > 60,
+         (scale(r, 0.45, lo=40), scale(g, 0.55, hi=65), scale(b, 0.35, lo=28))),
         # Dark → very dark with green hint
-        return (max(int(r * 0.3), 18), min(int(g * 0.4), 30), max(int(b * 0.3), 15), a)
-    else:
-        return (min(r + 3, 25), min(g + 5, 22), min(b + 3, 18), a)
-
-
-def draw_jr_body(d, cx, cy, pose_data=None):
-    """Draw Johnny Rotten's body. Returns key points for guitar attachment."""
-    p = pose_data or {}
-    head_tilt = p.get("head_tilt", 0)
-    torso_lean = p.get("torso_lean", 0)
-    l_arm_angle = p.get("l_arm_angle", -30)
-    r_arm_angle = p.get("r_arm_angle", 30)
-
+        (brightness > 30,
+         (scale(r, 0.3, lo=18), scale(g, 0.4, hi=30), scale(b, 0.3, lo=15))),
+    ], (np.minimum(r + 3, 25), np.minimum(g + 5, 22), np.minimum(b + 3, 18)))
+
+
+def _spiky_hair(name, spike_xs, h_range, tip_range, tip_t, thick_t=0.0):
+    """Pixel offsets of a spiky hairdo from the top of the head, per colour band.
+
+    Spike heights and tip lean are drawn once, so the hair holds its shape
+    on every frame. Returns ((dx, dy) for the base, (dx, dy) for the tips):
+    the tip band starts at tip_t up each spike, and below thick_t each
+    pixel gets a thickening pixel to its right. Overlaps are resolved here,
+    so each band is a plain vector store per draw.
+    """
+    rng = sheet_rng(name)
+    spike_hs = rng.integers(*h_range, len(spike_xs), endpoint=True)
+    tip_offs = rng.integers(-tip_range, tip_range, len(spike_xs), endpoint=True)
+    j = np.arange(spike_hs.sum()) - np.repeat(np.cumsum(spike_hs) - spike_hs, spike_hs)
+    t = j / np.repeat(spike_hs, spike_hs)
+    dx = np.floor(np.repeat(spike_xs, spike_hs) + np.repeat(tip_offs, spike_hs) * t)
+    dx = dx.astype(np.int64)
+    band = (t >= tip_t).astype(np.int64)
+    # Each hair pixel, followed by its thickening pixel where there is one
+    xs = np.stack([dx, dx + 1], axis=1).ravel()
+    ys = np.repeat(-j, 2)
+    keep = np.stack([np.ones_like(t, dtype=bool), t < thick_t], axis=1).ravel()
+    xs, ys, band = xs[keep], ys[keep], np.repeat(band, 2)[keep]
+    # Later pixels win where spikes overlap, as when they were plotted in order
+    _, last = np.unique(((ys << 16) + xs)[::-1], return_index=True)
+    keep = len(xs) - 1 - last
+    return tuple((xs[keep[band[keep] == i]], ys[keep[band[keep] == i]]) for i in (0, 1))
+
+
+def draw_hair(d, head_cx, head_top, spikes, colors):
+    """Plot a _spiky_hair result with its top at (head_cx, head_top)."""
+    for (xs, ys), color in zip(spikes, colors):
+        draw_points(d.arr, head_cx + xs, head_top + ys, color)
+
+
+JR_HAIR_SPIKES = _spiky_hair("johnny_rotten_hair", np.arange(-4, 5, 2), (6, 12), 2, 0.5, 0.3)
+SV_HAIR_SPIKES = _spiky_hair("sid_vicious_hair", np.arange(-3, 4, 2), (5, 10), 0, 0.6)
+JR_HAIR_RGBA = (as_rgba(JR_HAIR), as_rgba(JR_HAIR_TIP))
+
+
+def _draw_jr_lower(d, cx, cy, leg_spread, torso_lean):
+    """Legs, boots and torso — everything drawn beneath the arms."""
     hip_y = cy + 14
     foot_y = cy + 34
-    leg_spread = p.get("leg_spread", 5)
 
     # Legs (black drainpipes)
     ll_x = cx - leg_spread + torso_lean
@@ -165,26 +247,9 @@ def draw_jr_body(d, cx, cy, pose_data=None):
     d.line([torso_cx - 8, torso_top + 4, torso_cx - 6, torso_top + 2], fill=JR_SAFETY_PIN)
     d.line([torso_cx + 7, torso_top + 6, torso_cx + 9, torso_top + 4], fill=JR_SAFETY_PIN)
 
-    # Arms
-    arm_len = 18
-    shoulder_y = torso_top + 3
-
-    la_rad = math.radians(l_arm_angle)
-    la_ex = torso_cx - 10 + int(arm_len * math.sin(la_rad))
-    la_ey = shoulder_y + int(arm_len * math.cos(la_rad))
-    d.line([torso_cx - 10, shoulder_y, la_ex, la_ey], fill=JR_JACKET, width=4)
-    d.ellipse([la_ex - 2, la_ey - 2, la_ex + 2, la_ey + 2], fill=JR_SKIN)
-
-    ra_rad = math.radians(r_arm_angle)
-    ra_ex = torso_cx + 10 + int(arm_len * math.sin(ra_rad))
-    ra_ey = shoulder_y + int(arm_len * math.cos(ra_rad))
-    d.line([torso_cx + 10, shoulder_y, ra_ex, ra_ey], fill=JR_JACKET, width=4)
-    d.ellipse([ra_ex - 2, ra_ey - 2, ra_ex + 2, ra_ey + 2], fill=JR_SKIN)
 
-    # Head
-    head_cx = torso_cx + head_tilt
-    head_cy = torso_top - 10
-    head_w, head_h = 9, 12
+def _draw_jr_head(d, head_cx, head_cy, head_w, head_h):
+    """Head and sneer — drawn over the arms."""
     d.ellipse([head_cx - head_w // 2, head_cy - head_h // 2,
                head_cx + head_w // 2, head_cy + head_h // 2],
               fill=JR_SKIN, outline=JR_OUTLINE)
@@ -194,21 +259,101 @@ def draw_jr_body(d, cx, cy, pose_data=None):
     # Sneering mouth
     d.line([head_cx - 2, head_cy + 2, head_cx + 2, head_cy + 3], fill=JR_OUTLINE)
 
+
+def _layer_tiles(px, ox, oy):
+    """Split px's opaque pixels into one (dx, dy, mask, color) tile per colour.
+
+    Each mask is a uint8 array cropped to that colour's bounding box, placed
+    at (dx, dy) relative to (ox, oy).
+    """
+    opaque = px[..., 3] > 0
+    key = (px[..., 0].astype(np.uint32) << 24 | px[..., 1].astype(np.uint32) << 16
+           | px[..., 2].astype(np.uint32) << 8 | px[..., 3])
+    tiles = []
+    for k in np.unique(key[opaque]):
+        ys, xs = np.nonzero(opaque & (key == k))
+        y0, x0 = ys.min(), xs.min()
+        mask = np.zeros((ys.max() - y0 + 1, xs.max() - x0 + 1), np.uint8)
+        mask[ys - y0, xs - x0] = 255
+        color = (int(k >> 24), int(k >> 16 & 255), int(k >> 8 & 255), int(k & 255))
+        tiles.append((int(x0) - ox, int(y0) - oy, mask, color))
+    return tuple(tiles)
+
+
+@lru_cache(maxsize=64)
+def _body_layers(draw_lower, draw_head, leg_spread, torso_lean, head_tilt):
+    """Rasterize a boss's static body parts once per pose key.
+
+    Returns (lower, upper) tile layers relative to (cx, cy); the arms and
+    the hair are drawn per frame between and after them.
+    """
+    ox, oy = FW, FH
+    layers = []
+    for draw_layer in (
+            lambda d: draw_lower(d, ox, oy, leg_spread, torso_lean),
+            lambda d: draw_head(d, ox + torso_lean + head_tilt, oy - 18, 9, 12)):
+        scratch = np.zeros((FH * 2, FW * 2, 4), dtype=np.uint8)
+        draw_layer(ArrayDraw(scratch))
+        layers.append(_layer_tiles(scratch, ox, oy))
+    return tuple(layers)
+
+
+@lru_cache(maxsize=128)
+def _arm_tiles(angle_deg, sleeve, hand, arm_len=18):
+    """Rasterize one arm (4px sleeve + hand) hanging at angle_deg from its shoulder.
+
+    Returns (tiles, (hx, hy)): tile layer and hand offset relative to the shoulder.
+    """
+    rad = math.radians(angle_deg)
+    hx, hy = int(arm_len * math.sin(rad)), int(arm_len * math.cos(rad))
+    ox = oy = arm_len + 4
+    scratch = np.zeros((2 * ox + 1, 2 * ox + 1, 4), dtype=np.uint8)
+    d = ArrayDraw(scratch)
+    d.line([ox, oy, ox + hx, oy + hy], fill=sleeve, width=4)
+    d.ellipse([ox + hx - 2, oy + hy - 2, ox + hx + 2, oy + hy + 2], fill=hand)
+    return _layer_tiles(scratch, ox, oy), (hx, hy)
+
+
+def draw_arm(d, sx, sy, angle_deg, sleeve, hand):
+    """Stamp a cached arm from shoulder (sx, sy); returns the hand position."""
+    tiles, (hx, hy) = _arm_tiles(angle_deg, sleeve, hand)
+    _stamp_layer(d, sx, sy, tiles)
+    return sx + hx, sy + hy
+
+
+def _stamp_layer(d, cx, cy, layer):
+    """Blit a tile layer at (cx, cy): one d.bitmap per colour."""
+    for dx, dy, mask, color in layer:
+        d.bitmap((cx + dx, cy + dy), mask, fill=color)
+
+
+def draw_jr_body(d, cx, cy, pose_data=None):
+    """Draw Johnny Rotten's body. Returns key points for guitar attachment."""
+    p = pose_data or {}
+    head_tilt = p.get("head_tilt", 0)
+    torso_lean = p.get("torso_lean", 0)
+    l_arm_angle = p.get("l_arm_angle", -30)
+    r_arm_angle = p.get("r_arm_angle", 30)
+    leg_spread = p.get("leg_spread", 5)
+
+    lower, upper = _body_layers(_draw_jr_lower, _draw_jr_head, leg_spread, torso_lean, head_tilt)
+    _stamp_layer(d, cx, cy, lower)
+
+    # Arms
+    torso_top = cy - 8
+    torso_cx = cx + torso_lean
+    shoulder_y = torso_top + 3
+    la_ex, la_ey = draw_arm(d, torso_cx - 10, shoulder_y, l_arm_angle, JR_JACKET, JR_SKIN)
+    ra_ex, ra_ey = draw_arm(d, torso_cx + 10, shoulder_y, r_arm_angle, JR_JACKET, JR_SKIN)
+
+    # Head
+    head_cx = torso_cx + head_tilt
+    head_cy = torso_top - 10
+    head_h = 12
+    _stamp_layer(d, cx, cy, upper)
+
     # Spiky orange hair (upward spikes)
-    for spike_x in range(-4, 5, 2):
-        spike_h = random.randint(6, 12)
-        base_x = head_cx + spike_x
-        tip_x = base_x + random.randint(-2, 2)
-        tip_y = head_cy - head_h // 2 - spike_h
-        for j in range(spike_h):
-            t = j / spike_h
-            hx = int(base_x + (tip_x - base_x) * t)
-            hy = head_cy - head_h // 2 - j
-            if 0 <= hy < FH:
-                c = JR_HAIR if t < 0.5 else JR_HAIR_TIP
-                d.point([hx, hy], fill=c)
-                if t < 0.3:
-                    d.point([hx + 1, hy], fill=c)
+    draw_hair(d, head_cx, head_cy - head_h // 2, JR_HAIR_SPIKES, JR_HAIR_RGBA)
 
     return {
         "l_hand": (la_ex, la_ey),
@@ -220,86 +365,223 @@ def draw_jr_body(d, cx, cy, pose_data=None):
 
 def draw_jr_guitar(d, x, y, angle_deg=0):
     """Draw Johnny Rotten's battered Telecaster."""
-    body_w, body_h = 14, 10
+    _stamp_layer(d, x, y, _instrument_tiles(_raster_jr_guitar, angle_deg))
+
+
+def _raster_jr_guitar(d, x, y, angle_deg):
+    body_w = 14
     neck_len = 18
     angle = math.radians(angle_deg)
-    cos_a, sin_a = math.cos(angle), math.sin(angle)
-
-    for dy in range(-body_h // 2, body_h // 2 + 1):
-        for dx in range(-body_w // 2, body_w // 2 + 1):
-            if (dx / (body_w / 2.0)) ** 2 + (dy / (body_h / 2.0)) ** 2 <= 1:
-                rx = x + int(dx * cos_a - dy * sin_a)
-                ry = y + int(dx * sin_a + dy * cos_a)
-                dist = math.sqrt(dx * dx + dy * dy)
-                max_r = math.sqrt((body_w / 2) ** 2 + (body_h / 2) ** 2)
-                t = dist / max_r
-                if t < 0.4:
-                    c = JR_GUITAR_BODY_LIGHT
-                elif t < 0.7:
-                    c = JR_GUITAR_BODY
-                else:
-                    c = JR_GUITAR_BODY_DARK
-                d.point([rx, ry], fill=c)
+    # Rotation as 8.8 fixed point so every offset below is integer-only
+    cs = int(round(math.cos(angle) * 256))
+    sn = int(round(math.sin(angle) * 256))
+
+    draw_body_ellipse(d, x, y, JR_BODY_LUT, cs, sn,
+                      (JR_GUITAR_BODY_LIGHT, JR_GUITAR_BODY, JR_GUITAR_BODY_DARK))
 
     for offset in [-2, 3]:
-        px = x + int(offset * cos_a)
-        py = y + int(offset * sin_a)
+        px = x + ((offset * cs) >> 8)
+        py = y + ((offset * sn) >> 8)
         d.rectangle([px - 2, py - 1, px + 2, py + 1], fill=JR_GUITAR_PICKUP)
 
-    d.point([x + int(5 * cos_a), y + int(5 * sin_a)], fill=JR_GUITAR_GOLD)
+    bx = x + ((5 * cs) >> 8)
+    by = y + ((5 * sn) >> 8)
+    d.point([bx, by], fill=JR_GUITAR_GOLD)
 
-    for i in range(neck_len):
-        nx = x + int((-body_w // 2 - i) * cos_a)
-        ny = y + int((-body_w // 2 - i) * sin_a)
-        d.rectangle([nx - 1, ny - 1, nx + 1, ny + 1], fill=JR_GUITAR_NECK)
-        if i % 5 == 0:
-            d.point([nx, ny], fill=JR_GUITAR_NECK_DARK)
+    draw_neck(d.arr, x, y, cs, sn, -body_w // 2, neck_len,
+              as_rgba(JR_GUITAR_NECK), as_rgba(JR_GUITAR_NECK_DARK), 5)
 
-    hx = x + int((-body_w // 2 - neck_len) * cos_a)
-    hy = y + int((-body_w // 2 - neck_len) * sin_a)
+    off = -body_w // 2 - neck_len
+    hx = x + ((off * cs) >> 8)
+    hy = y + ((off * sn) >> 8)
     d.rectangle([hx - 3, hy - 3, hx + 3, hy + 3], fill=JR_GUITAR_HEAD)
     for peg_off in [-2, 0, 2]:
         d.point([hx - 4, hy + peg_off], fill=JR_GUITAR_GOLD)
         d.point([hx + 4, hy + peg_off], fill=JR_GUITAR_GOLD)
 
-    bx = x + int(5 * cos_a)
-    by = y + int(5 * sin_a)
     d.line([bx, by, hx, hy], fill=JR_GUITAR_STRING, width=1)
 
 
-def draw_sound_rings(d, cx, cy, num_rings, max_radius, alpha_base=180):
-    """Draw expanding sound wave rings."""
-    for i in range(num_rings):
-        t = (i + 1) / num_rings
-        r = int(max_radius * t)
-        alpha = max(20, int(alpha_base * (1 - t)))
-        color = (*SOUND_RING[:3], alpha)
-        d.ellipse([cx - r, cy - r // 2, cx + r, cy + r // 2], outline=color, width=1)
-
-
-def draw_flames(d, cx, base_y, height, width, intensity=1.0):
-    """Draw rising flame effect."""
-    for _ in range(int(12 * intensity)):
-        fx = cx + random.randint(-width, width)
-        flame_h = random.randint(int(height * 0.3), height)
-        fy = base_y - flame_h
-        colors = [FLAME_RED, FLAME_ORANGE, FLAME_YELLOW]
-        for j in range(flame_h):
-            t = j / flame_h
-            c = colors[min(int(t * 3), 2)]
-            py = base_y - j
-            px = fx + random.randint(-1, 1)
-            d.point([px, py], fill=c)
-        d.point([fx, fy], fill=FLAME_YELLOW)
+@njit(cache=True)
+def draw_neck(arr, x, y, cs, sn, start, length, rgba, fret_rgba, fret_every):
+    """Instrument neck: 3x3 squares stepping from offset start away from the
+    body along the 8.8 fixed-point direction (cs, sn), with a fret dot on
+    every fret_every-th square. Drawn in order, so later squares cover
+    earlier dots exactly as the per-call version did."""
+    for i in range(length):
+        off = start - i
+        nx = x + ((off * cs) >> 8)
+        ny = y + ((off * sn) >> 8)
+        fill_rect(arr, nx - 1, ny - 1, nx + 1, ny + 1, rgba)
+        if i % fret_every == 0:
+            fill_rect(arr, nx, ny, nx, ny, fret_rgba)
+
+
+@lru_cache(maxsize=64)
+def _instrument_tiles(raster_fn, angle_deg):
+    """Render an instrument once per angle; tiles are relative to its body centre.
+
+    Sheets reuse a handful of angles (the pyro guitar and the slung bass never
+    move), so most calls are just a per-colour blit.
+    """
+    ox = oy = FH // 2
+    scratch = np.zeros((FH, FH, 4), dtype=np.uint8)
+    raster_fn(ArrayDraw(scratch), ox, oy, angle_deg)
+    return _layer_tiles(scratch, ox, oy)
+
+
+def _body_lut(body_w, body_h):
+    """Upright body pixels (dx, dy, band) in row-major order.
+
+    band indexes the (light, mid, dark) colours: the inner 40%, 40-70% and
+    outer rings of the corner radius. Built once per instrument at import.
+    """
+    dy, dx = np.mgrid[-body_h // 2:body_h // 2 + 1, -body_w // 2:body_w // 2 + 1]
+    inside = (dx / (body_w / 2.0)) ** 2 + (dy / (body_h / 2.0)) ** 2 <= 1
+    dx, dy = dx[inside], dy[inside]
+    # Band edges compared squared against the corner radius
+    max_r2 = (body_w / 2) ** 2 + (body_h / 2) ** 2
+    d2 = dx * dx + dy * dy
+    band = (d2 >= 0.4 ** 2 * max_r2).astype(np.int64) + (d2 >= 0.7 ** 2 * max_r2)
+    return dx, dy, band
+
+
+JR_BODY_LUT = _body_lut(14, 10)
+SV_BODY_LUT = _body_lut(12, 9)
+
+
+def draw_body_ellipse(d, x, y, lut, cs, sn, colors):
+    """Raster a rotated, three-band shaded instrument body in one pass.
+
+    lut: (dx, dy, band) from _body_lut.
+    cs, sn: cos/sin of the rotation as 8.8 fixed point (scaled by 256).
+    colors: (light, mid, dark) for the band indices.
+    """
+    dx, dy, band = lut
+    rx = x + ((dx * cs - dy * sn) >> 8)
+    ry = y + ((dx * sn + dy * cs) >> 8)
+    plot_banded(d, rx, ry, band, colors)
+
+
+def plot_banded(d, xs, ys, band, colors):
+    """Plot point i in colors[band[i]]; later points win where they overlap."""
+    _scatter(d.arr, xs, ys, np.array([as_rgba(c) for c in colors])[band])
+
+
+@lru_cache(maxsize=16)
+def _ring_stamp(num_rings, max_radius, alpha_base, x_lo, x_hi, y_lo, y_hi):
+    """Pre-baked sound ring pixels (dx, dy, rgba) around the emitter.
+
+    Only offsets in [x_lo, x_hi) x [y_lo, y_hi) are evaluated: the widest
+    rings are ~80px across against a 48px frame, so much of their grid
+    would only be clipped away.
+    """
+    x0, x1 = max(-max_radius - 1, x_lo), min(max_radius + 2, x_hi)
+    y0, y1 = max(-max_radius // 2 - 1, y_lo), min(max_radius // 2 + 2, y_hi)
+    t = np.arange(1, num_rings + 1) / num_rings
+    radii = (max_radius * t).astype(int) / 2.0
+    alphas = np.maximum(20, (alpha_base * (1 - t)).astype(int))
+    ys, xs = np.mgrid[y0:max(y0, y1), x0:max(x0, x1)]
+    # Distance in vertical-radius units; each pixel takes its nearest ring
+    off = np.abs(np.hypot(xs / 2.0, ys)[..., None] - radii)
+    ring = off.argmin(axis=-1)
+    on = off.min(axis=-1) < 0.5
+    rgba = np.empty((int(on.sum()), 4), np.uint8)
+    rgba[:, :3] = SOUND_RING[:3]
+    rgba[:, 3] = alphas[ring[on]]
+    return xs[on], ys[on], rgba
+
+
+def draw_sound_rings(arr, cx, cy, num_rings, max_radius, alpha_base=180):
+    """Stamp expanding 2:1 sound wave rings into an (H, W, 4) sheet array."""
+    if num_rings < 1:
+        return
+    h, w = arr.shape[:2]
+    dx, dy, rgba = _ring_stamp(num_rings, max_radius, alpha_base, -cx, w - cx, -cy, h - cy)
+    arr[cy + dy, cx + dx] = rgba
+
+
+def _glow_stamp(radius, half_h, strength):
+    """Pre-baked additive glow (dx, dy, alpha): radial falloff inside a
+    2*radius x 2*half_h box around the centre."""
+    dy, dx = np.mgrid[-half_h:half_h, -radius:radius]
+    dist = np.sqrt(dx ** 2 + dy ** 2)
+    near = dist < radius
+    return dx[near], dy[near], (strength * (1 - dist[near] / radius)).astype(np.int16)
+
+
+CHORD_FLASH = _glow_stamp(6, 4, 150)
+
+
+def add_glow(arr, x, y, stamp):
+    """Brighten arr around (x, y) by a _glow_stamp: +a to R/G, +a/2 to B, alpha raised to a."""
+    dx, dy, alpha = stamp
+    xs, ys = x + dx, y + dy
+    h, w = arr.shape[:2]
+    ok = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    xs, ys, alpha = xs[ok], ys[ok], alpha[ok]
+    px = arr[ys, xs].astype(np.int16)
+    px[:, 0] += alpha
+    px[:, 1] += alpha
+    px[:, 2] += alpha // 2
+    px[:, 3] = np.maximum(px[:, 3], alpha)
+    arr[ys, xs] = np.minimum(px, 255)
+
+
+def draw_flames(arr, rng, cxs, base_y, height, width, intensity=1.0):
+    """Draw rising flames from every emitter x in cxs into an (H, W, 4) sheet array."""
+    per_emitter = int(12 * intensity)
+    n_flames = per_emitter * len(cxs)
+    fxs = np.repeat(cxs, per_emitter) + rng.integers(-width, width, n_flames, endpoint=True)
+    flame_hs = rng.integers(int(height * 0.3), height, n_flames, endpoint=True)
+    # Each flame is a jittered column of flame_h pixels plus a yellow tip at
+    # j == flame_h, laid out flame by flame in draw order.
+    lens = flame_hs + 1
+    j = np.arange(lens.sum()) - np.repeat(np.cumsum(lens) - lens, lens)
+    h = np.repeat(flame_hs, lens)
+    tip = j == h
+    xs = np.repeat(fxs, lens)
+    xs[~tip] += rng.integers(-1, 1, int(flame_hs.sum()), endpoint=True)
+    band = np.minimum((j / h * 3).astype(int), 2)
+    _scatter(arr, xs, base_y - j, FLAME_RGBA[band])
+
+
+def _scatter(arr, xs, ys, rgba):
+    """Write rgba[i] at (xs[i], ys[i]), clipped to arr; later points win."""
+    h, w = arr.shape[:2]
+    ok = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    xs, ys, rgba = xs[ok], ys[ok], rgba[ok]
+    key = (ys * w + xs)[::-1]
+    _, last = np.unique(key, return_index=True)
+    keep = len(key) - 1 - last
+    arr[ys[keep], xs[keep]] = rgba[keep]
+
+
+def splatter(arr, xs, ys, boost, empty_rgba=None):
+    """Shift lit pixels at (xs, ys) by boost; fill empty ones from empty_rgba.
+
+    boost is a signed per-channel RGB offset, saturated to 0..255.
+    Off-sheet points are dropped and repeats of a pixel count once.
+    """
+    h, w = arr.shape[:2]
+    ok = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    _, first = np.unique(ys[ok] * w + xs[ok], return_index=True)
+    idx = np.flatnonzero(ok)[first]
+    xs, ys = xs[idx], ys[idx]
+    lit = arr[ys, xs, 3] > 0
+    arr[ys[lit], xs[lit], :3] = np.clip(arr[ys[lit], xs[lit], :3] + boost, 0, 255)
+    if empty_rgba is not None:
+        arr[ys[~lit], xs[~lit]] = empty_rgba[idx][~lit]
 
 
 def jr_sweep_sheet():
     """Guitar swing L to R — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
     for f in range(nf):
-        cx = f * FW + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         guitar_angle = -60 + f * 24
         lean = int((f - 2.5) * 2)
@@ -309,54 +591,46 @@ def jr_sweep_sheet():
         pts = draw_jr_body(d, cx, cy, pose)
         draw_jr_guitar(d, pts["r_hand"][0], pts["r_hand"][1], guitar_angle)
         if f >= 3:
-            for tx in range(pts["r_hand"][0] - 10, pts["r_hand"][0] + 10):
-                for ty in range(pts["r_hand"][1] - 5, pts["r_hand"][1] + 5):
-                    if 0 <= tx < img.width and 0 <= ty < FH:
-                        r0, g0, b0, a0 = img.getpixel((tx, ty))
-                        if a0 == 0:
-                            img.putpixel((tx, ty), (*MOTION_BLUR, 30 + (f - 3) * 15))
+            hx, hy = pts["r_hand"]
+            region = frame[max(hy - 5, 0):hy + 5, max(hx - 10, 0):hx + 10]
+            region[region[..., 3] == 0] = (*MOTION_BLUR, 30 + (f - 3) * 15)
     path = BOSS_DIR / "johnny_rotten_sweep_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def jr_feedback_sheet():
     """Guitar raised, sound rings expanding — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
+    rng = sheet_rng("johnny_rotten_feedback")
     for f in range(nf):
-        cx = f * FW + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         pose = {"torso_lean": -2, "head_tilt": -1,
                 "l_arm_angle": -70 - f * 3, "r_arm_angle": -60 - f * 3, "leg_spread": 7}
         draw_jr_body(d, cx, cy, pose)
         gx, gy = cx, cy - 28 - f
         draw_jr_guitar(d, gx, gy, -80 + f * 5)
-        if f >= 1:
-            draw_sound_rings(d, gx, gy, f, 8 + f * 6)
+        draw_sound_rings(frame, gx, gy, f, 8 + f * 6)
         if f >= 3:
-            for _ in range(f * 2):
-                vx = cx + random.randint(-15, 15)
-                vy = cy + random.randint(-20, 20)
-                if 0 <= vx < img.width and 0 <= vy < FH:
-                    r0, g0, b0, a0 = img.getpixel((vx, vy))
-                    if a0 > 0:
-                        img.putpixel((vx, vy), (min(r0 + 30, 255), min(g0 + 20, 255),
-                                                  min(b0 + 50, 255), a0))
+            vxs = cx + rng.integers(-15, 15, f * 2, endpoint=True)
+            vys = cy + rng.integers(-20, 20, f * 2, endpoint=True)
+            splatter(frame, vxs, vys, VIBRATION_BOOST)
     path = BOSS_DIR / "johnny_rotten_feedback_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def jr_pyro_sheet():
     """Flames rising around him — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
+    rng = sheet_rng("johnny_rotten_pyro")
     for f in range(nf):
-        x_off = f * FW
-        cx = x_off + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         pose = {"torso_lean": 0, "head_tilt": 0,
                 "l_arm_angle": -45 + f * 5, "r_arm_angle": 45 - f * 5, "leg_spread": 8}
@@ -364,30 +638,28 @@ def jr_pyro_sheet():
         draw_jr_guitar(d, cx + 12, cy + 8, 30)
         flame_intensity = (f + 1) / nf
         flame_height = 15 + f * 8
-        for fxo in [-15, -8, 0, 8, 15]:
-            draw_flames(d, cx + fxo, cy + 34, flame_height, 3, flame_intensity)
+        draw_flames(frame, rng, cx + FLAME_EMITTERS, cy + 34, flame_height, 3, flame_intensity)
         if f >= 2:
-            for hy in range(0, cy - 10):
-                for hx in range(x_off + 5, x_off + FW - 5):
-                    if 0 <= hx < img.width and 0 <= hy < FH:
-                        r0, g0, b0, a0 = img.getpixel((hx, hy))
-                        if a0 > 0:
-                            warm = min(f * 8, 40)
-                            img.putpixel((hx, hy), (min(r0 + warm, 255), g0,
-                                                      max(b0 - warm // 2, 0), a0))
+            warm = min(f * 8, 40)
+            # Full-row strip of the frame; tint channels in place with
+            # uint8 saturating add/sub rather than gathering lit pixels
+            region = frame[0:cy - 10, 5:FW - 5]
+            lit = region[..., 3] > 0
+            red, blue = region[..., 0], region[..., 2]
+            np.putmask(red, lit, np.minimum(red, 255 - warm) + warm)
+            np.putmask(blue, lit, np.maximum(blue, warm // 2) - warm // 2)
     path = BOSS_DIR / "johnny_rotten_pyro_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def jr_chord_sheet():
     """Strum pose, projectile launch — 4 frames."""
     nf = 4
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
     for f in range(nf):
-        x_off = f * FW
-        cx = x_off + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         strum_offset = [0, -2, 2, 0][f]
         pose = {"torso_lean": 2, "head_tilt": 1,
@@ -397,22 +669,12 @@ def jr_chord_sheet():
         gx, gy = cx + 5, cy + 2
         draw_jr_guitar(d, gx, gy, 15 + strum_offset * 3)
         if f == 1:
-            for sx in range(gx - 6, gx + 6):
-                for sy in range(gy - 4, gy + 4):
-                    if 0 <= sx < img.width and 0 <= sy < FH:
-                        dist = math.sqrt((sx - gx) ** 2 + (sy - gy) ** 2)
-                        if dist < 6:
-                            alpha = int(150 * (1 - dist / 6))
-                            r0, g0, b0, a0 = img.getpixel((sx, sy))
-                            img.putpixel((sx, sy), (min(r0 + alpha, 255),
-                                                     min(g0 + alpha, 255),
-                                                     min(b0 + alpha // 2, 255),
-                                                     max(a0, alpha)))
+            add_glow(frame, gx, gy, CHORD_FLASH)
         if f >= 2:
             proj_dist = (f - 1) * 12
             proj_x = cx + 15 + proj_dist
             proj_y = cy - 5
-            if proj_x < x_off + FW:
+            if proj_x < FW:
                 pr = 4
                 d.ellipse([proj_x - pr, proj_y - pr, proj_x + pr, proj_y + pr],
                           fill=PUNK_GREEN)
@@ -420,18 +682,18 @@ def jr_chord_sheet():
                           proj_x + pr + 2, proj_y + pr + 2],
                           outline=(*SOUND_RING[:3], 120))
     path = BOSS_DIR / "johnny_rotten_chord_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def jr_solo_sheet():
     """Fast strumming, motion blur — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
+    rng = sheet_rng("johnny_rotten_solo")
     for f in range(nf):
-        x_off = f * FW
-        cx = x_off + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         phase = math.sin(f * math.pi * 0.8)
         pose = {"torso_lean": int(phase * 3), "head_tilt": int(phase * 2),
@@ -441,33 +703,29 @@ def jr_solo_sheet():
         gx = cx + 4 + int(phase * 2)
         gy = cy + 1
         draw_jr_guitar(d, gx, gy, 12 + int(phase * 8))
-        for _ in range(8 + f * 2):
-            bx = gx + random.randint(-8, 8)
-            by = gy + random.randint(-5, 5)
-            if 0 <= bx < img.width and 0 <= by < FH:
-                r0, g0, b0, a0 = img.getpixel((bx, by))
-                if a0 == 0:
-                    img.putpixel((bx, by), (*MOTION_BLUR, 40 + random.randint(0, 40)))
-                else:
-                    img.putpixel((bx, by), (min(r0 + 20, 255), min(g0 + 10, 255),
-                                              min(b0 + 30, 255), a0))
-        for _ in range(4):
-            angle = random.uniform(-0.5, 0.5) + math.pi * (0.5 if phase > 0 else -0.5)
-            line_len = random.randint(8, 18)
-            sx = gx + int(6 * math.cos(angle))
-            sy = gy + int(3 * math.sin(angle))
-            ex = sx + int(line_len * math.cos(angle))
-            ey = sy + int(line_len * math.sin(angle))
-            d.line([sx, sy, ex, ey], fill=(*SOUND_RING[:3], 100), width=1)
+        n_blur = 8 + f * 2
+        bxs = gx + rng.integers(-8, 8, n_blur, endpoint=True)
+        bys = gy + rng.integers(-5, 5, n_blur, endpoint=True)
+        blur = np.empty((n_blur, 4), dtype=np.uint8)
+        blur[:, :3] = MOTION_BLUR
+        blur[:, 3] = 40 + rng.integers(0, 40, n_blur, endpoint=True)
+        splatter(frame, bxs, bys, SOLO_BLUR_BOOST, blur)
+        # Speed lines off the strumming hand, then green sparks
+        angles = rng.uniform(-0.5, 0.5, 4) + math.pi * (0.5 if phase > 0 else -0.5)
+        line_lens = rng.integers(8, 18, 4, endpoint=True)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        x0s = gx + (6 * cos_a).astype(np.int64)
+        y0s = gy + (3 * sin_a).astype(np.int64)
+        draw_segments(frame, x0s, y0s, x0s + (line_lens * cos_a).astype(np.int64),
+                      y0s + (line_lens * sin_a).astype(np.int64), SPEED_LINE_RGBA)
         if f >= 2:
-            for _ in range(f):
-                sx = cx + random.randint(-18, 18)
-                sy = cy + random.randint(-25, 15)
-                if x_off <= sx < x_off + FW and 0 <= sy < FH:
-                    d.point([sx, sy], fill=PUNK_GREEN)
+            spark_xs = cx + rng.integers(-18, 18, f, endpoint=True)
+            spark_ys = cy + rng.integers(-25, 15, f, endpoint=True)
+            ok = ((spark_xs >= 0) & (spark_xs < FW)
+                  & (spark_ys >= 0) & (spark_ys < FH))
+            frame[spark_ys[ok], spark_xs[ok]] = SPARK_RGBA
     path = BOSS_DIR / "johnny_rotten_solo_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -479,6 +737,7 @@ SV_SKIN = (195, 165, 145)
 SV_SKIN_SHADOW = (160, 130, 110)
 SV_HAIR = (15, 12, 10)         # Black spiky hair
 SV_HAIR_TIP = (35, 28, 22)
+SV_HAIR_RGBA = (as_rgba(SV_HAIR), as_rgba(SV_HAIR_TIP))
 SV_CHEST = (195, 165, 145)     # Shirtless
 SV_VEST = (25, 20, 18)         # Black leather vest (open)
 SV_VEST_LIGHT = (45, 38, 32)
@@ -500,50 +759,39 @@ SV_BASS_STRING = (200, 200, 210)
 SV_BASS_PICKUP = (55, 50, 45)
 
 
-def remap_sid_vicious(r, g, b, a):
+def remap_sid_vicious(px):
     """Disco King → Sid Vicious: shirtless, leather vest, chains, spiky black hair."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 160:
+    r, g, b, brightness, is_gray = remap_channels(px)
+    return remap_select(px, [
         # Very light (disco suit) → exposed skin
-        return (min(int(brightness * 0.8), 195), min(int(brightness * 0.65), 165),
-                min(int(brightness * 0.55), 145), a)
-    elif is_gray and brightness > 120:
+        (is_gray & (brightness > 160),
+         (scale(brightness, 0.8, hi=195), scale(brightness, 0.65, hi=165),
+          scale(brightness, 0.55, hi=145))),
         # Light body → leather vest dark
-        return (max(int(r * 0.2), 22), max(int(g * 0.18), 18), max(int(b * 0.18), 16), a)
-    elif is_gray and brightness > 80:
+        (is_gray & (brightness > 120),
+         (scale(r, 0.2, lo=22), scale(g, 0.18, lo=18), scale(b, 0.18, lo=16))),
         # Mid body → vest/leather
-        return (max(int(r * 0.25), 25), max(int(g * 0.22), 20), max(int(b * 0.25), 22), a)
-    elif brightness > 120 and r > b:
+        (is_gray & (brightness > 80),
+         (scale(r, 0.25, lo=25), scale(g, 0.22, lo=20), scale(b, 0.25, lo=22))),
         # Warm tones → pale punk skin
-        return (min(int(r * 0.9), 195), min(int(g * 0.75), 160), min(int(b * 0.7), 140), a)
-    elif brightness > 80 and b > r:
+        ((brightness > 120) & (r > b),
+         (scale(r, 0.9, hi=195), scale(g, 0.75, hi=160), scale(b, 0.7, hi=140))),
         # Cool tones → darker leather
-        return (max(int(r * 0.25), 20), max(int(g * 0.2), 15), max(int(b * 0.3), 25), a)
-    elif brightness > 60:
+        ((brightness > 80) & (b > r),
+         (scale(r, 0.25, lo=20), scale(g, 0.2, lo=15), scale(b, 0.3, lo=25))),
         # Mid → skin shadow
-        return (min(int(r * 0.75), 160), min(int(g * 0.6), 130), min(int(b * 0.5), 110), a)
-    elif brightness > 30:
+        (brightness > 60,
+         (scale(r, 0.75, hi=160), scale(g, 0.6, hi=130), scale(b, 0.5, hi=110))),
         # Dark → very dark
-        return (max(int(r * 0.3), 15), max(int(g * 0.25), 12), max(int(b * 0.25), 10), a)
-    else:
-        return (min(r + 2, 20), min(g + 2, 15), min(b + 2, 12), a)
+        (brightness > 30,
+         (scale(r, 0.3, lo=15), scale(g, 0.25, lo=12), scale(b, 0.25, lo=10))),
+    ], (np.minimum(r + 2, 20), np.minimum(g + 2, 15), np.minimum(b + 2, 12)))
 
 
-def draw_sv_body(d, cx, cy, pose_data=None):
-    """Draw Sid Vicious's body. Shirtless w/ open leather vest, chain necklace."""
-    p = pose_data or {}
-    head_tilt = p.get("head_tilt", 0)
-    torso_lean = p.get("torso_lean", 0)
-    l_arm_angle = p.get("l_arm_angle", -30)
-    r_arm_angle = p.get("r_arm_angle", 30)
-
+def _draw_sv_lower(d, cx, cy, leg_spread, torso_lean):
+    """Legs, boots, bare torso, vest and chain — everything beneath the arms."""
     hip_y = cy + 14
     foot_y = cy + 34
-    leg_spread = p.get("leg_spread", 5)
 
     # Legs (black leather)
     ll_x = cx - leg_spread + torso_lean
@@ -578,26 +826,9 @@ def draw_sv_body(d, cx, cy, pose_data=None):
     # Padlock at center
     d.rectangle([torso_cx - 1, chain_y + 1, torso_cx + 1, chain_y + 4], fill=SV_PADLOCK)
 
-    # Arms (bare skin + vest straps)
-    arm_len = 18
-    shoulder_y = torso_top + 3
-
-    la_rad = math.radians(l_arm_angle)
-    la_ex = torso_cx - 10 + int(arm_len * math.sin(la_rad))
-    la_ey = shoulder_y + int(arm_len * math.cos(la_rad))
-    d.line([torso_cx - 10, shoulder_y, la_ex, la_ey], fill=SV_SKIN, width=4)
-    d.ellipse([la_ex - 2, la_ey - 2, la_ex + 2, la_ey + 2], fill=SV_SKIN)
 
-    ra_rad = math.radians(r_arm_angle)
-    ra_ex = torso_cx + 10 + int(arm_len * math.sin(ra_rad))
-    ra_ey = shoulder_y + int(arm_len * math.cos(ra_rad))
-    d.line([torso_cx + 10, shoulder_y, ra_ex, ra_ey], fill=SV_SKIN, width=4)
-    d.ellipse([ra_ex - 2, ra_ey - 2, ra_ex + 2, ra_ey + 2], fill=SV_SKIN)
-
-    # Head
-    head_cx = torso_cx + head_tilt
-    head_cy = torso_top - 10
-    head_w, head_h = 9, 12
+def _draw_sv_head(d, head_cx, head_cy, head_w, head_h):
+    """Head and snarl — drawn over the arms."""
     d.ellipse([head_cx - head_w // 2, head_cy - head_h // 2,
                head_cx + head_w // 2, head_cy + head_h // 2],
               fill=SV_SKIN, outline=SV_OUTLINE)
@@ -608,16 +839,34 @@ def draw_sv_body(d, cx, cy, pose_data=None):
     d.line([head_cx - 2, head_cy + 2, head_cx, head_cy + 3], fill=SV_OUTLINE)
     d.line([head_cx, head_cy + 3, head_cx + 2, head_cy + 2], fill=SV_OUTLINE)
 
+
+def draw_sv_body(d, cx, cy, pose_data=None):
+    """Draw Sid Vicious's body. Shirtless w/ open leather vest, chain necklace."""
+    p = pose_data or {}
+    head_tilt = p.get("head_tilt", 0)
+    torso_lean = p.get("torso_lean", 0)
+    l_arm_angle = p.get("l_arm_angle", -30)
+    r_arm_angle = p.get("r_arm_angle", 30)
+    leg_spread = p.get("leg_spread", 5)
+
+    lower, upper = _body_layers(_draw_sv_lower, _draw_sv_head, leg_spread, torso_lean, head_tilt)
+    _stamp_layer(d, cx, cy, lower)
+
+    # Arms (bare skin + vest straps)
+    torso_top = cy - 8
+    torso_cx = cx + torso_lean
+    shoulder_y = torso_top + 3
+    la_ex, la_ey = draw_arm(d, torso_cx - 10, shoulder_y, l_arm_angle, SV_SKIN, SV_SKIN)
+    ra_ex, ra_ey = draw_arm(d, torso_cx + 10, shoulder_y, r_arm_angle, SV_SKIN, SV_SKIN)
+
+    # Head
+    head_cx = torso_cx + head_tilt
+    head_cy = torso_top - 10
+    head_h = 12
+    _stamp_layer(d, cx, cy, upper)
+
     # Spiky black hair (shorter, more vertical than JR)
-    for spike_x in range(-3, 4, 2):
-        spike_h = random.randint(5, 10)
-        base_x = head_cx + spike_x
-        for j in range(spike_h):
-            t = j / spike_h
-            hy = head_cy - head_h // 2 - j
-            if 0 <= hy < FH:
-                c = SV_HAIR if t < 0.6 else SV_HAIR_TIP
-                d.point([base_x, hy], fill=c)
+    draw_hair(d, head_cx, head_cy - head_h // 2, SV_HAIR_SPIKES, SV_HAIR_RGBA)
 
     return {
         "l_hand": (la_ex, la_ey),
@@ -629,40 +878,29 @@ def draw_sv_body(d, cx, cy, pose_data=None):
 
 def draw_sv_bass(d, x, y, angle_deg=0):
     """Draw Sid's Fender P-Bass."""
-    body_w, body_h = 12, 9
+    _stamp_layer(d, x, y, _instrument_tiles(_raster_sv_bass, angle_deg))
+
+
+def _raster_sv_bass(d, x, y, angle_deg):
+    body_w = 12
     neck_len = 20
     angle = math.radians(angle_deg)
-    cos_a, sin_a = math.cos(angle), math.sin(angle)
-
-    for dy in range(-body_h // 2, body_h // 2 + 1):
-        for dx in range(-body_w // 2, body_w // 2 + 1):
-            if (dx / (body_w / 2.0)) ** 2 + (dy / (body_h / 2.0)) ** 2 <= 1:
-                rx = x + int(dx * cos_a - dy * sin_a)
-                ry = y + int(dx * sin_a + dy * cos_a)
-                dist = math.sqrt(dx * dx + dy * dy)
-                max_r = math.sqrt((body_w / 2) ** 2 + (body_h / 2) ** 2)
-                t = dist / max_r
-                if t < 0.4:
-                    c = SV_BASS_BODY_LIGHT
-                elif t < 0.7:
-                    c = SV_BASS_BODY
-                else:
-                    c = SV_BASS_BODY_DARK
-                d.point([rx, ry], fill=c)
+    cs = int(round(math.cos(angle) * 256))
+    sn = int(round(math.sin(angle) * 256))
+
+    draw_body_ellipse(d, x, y, SV_BODY_LUT, cs, sn,
+                      (SV_BASS_BODY_LIGHT, SV_BASS_BODY, SV_BASS_BODY_DARK))
 
     d.rectangle([x - 2, y - 1, x + 2, y + 1], fill=SV_BASS_PICKUP)
-    for i in range(neck_len):
-        nx = x + int((-body_w // 2 - i) * cos_a)
-        ny = y + int((-body_w // 2 - i) * sin_a)
-        d.rectangle([nx - 1, ny - 1, nx + 1, ny + 1], fill=SV_BASS_NECK)
-        if i % 6 == 0:
-            d.point([nx, ny], fill=SV_BASS_NECK_DARK)
-
-    hx = x + int((-body_w // 2 - neck_len) * cos_a)
-    hy = y + int((-body_w // 2 - neck_len) * sin_a)
+    draw_neck(d.arr, x, y, cs, sn, -body_w // 2, neck_len,
+              as_rgba(SV_BASS_NECK), as_rgba(SV_BASS_NECK_DARK), 6)
+
+    off = -body_w // 2 - neck_len
+    hx = x + ((off * cs) >> 8)
+    hy = y + ((off * sn) >> 8)
     d.rectangle([hx - 3, hy - 3, hx + 3, hy + 3], fill=SV_BASS_HEAD)
-    bx = x + int(4 * cos_a)
-    by = y + int(4 * sin_a)
+    bx = x + ((4 * cs) >> 8)
+    by = y + ((4 * sn) >> 8)
     d.line([bx, by, hx, hy], fill=SV_BASS_STRING, width=1)
 
 
@@ -680,10 +918,11 @@ def draw_chain(d, x1, y1, x2, y2, segments=8):
 def sv_bass_swing_sheet():
     """Bass guitar swing L to R — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
     for f in range(nf):
-        cx = f * FW + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         bass_angle = -70 + f * 28
         lean = int((f - 2.5) * 3)
@@ -693,24 +932,21 @@ def sv_bass_swing_sheet():
         pts = draw_sv_body(d, cx, cy, pose)
         draw_sv_bass(d, pts["r_hand"][0], pts["r_hand"][1], bass_angle)
         if f >= 3:
-            for tx in range(pts["r_hand"][0] - 12, pts["r_hand"][0] + 12):
-                for ty in range(pts["r_hand"][1] - 6, pts["r_hand"][1] + 6):
-                    if 0 <= tx < img.width and 0 <= ty < FH:
-                        r0, g0, b0, a0 = img.getpixel((tx, ty))
-                        if a0 == 0:
-                            img.putpixel((tx, ty), (*MOTION_BLUR, 25 + (f - 3) * 20))
+            hx, hy = pts["r_hand"]
+            region = frame[max(hy - 6, 0):hy + 6, max(hx - 12, 0):hx + 12]
+            region[region[..., 3] == 0] = (*MOTION_BLUR, 25 + (f - 3) * 20)
     path = BOSS_DIR / "sid_vicious_bass_swing_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def sv_chain_whip_sheet():
     """Chain whip attack — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
     for f in range(nf):
-        cx = f * FW + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         # Windup then throw
         arm_angle = [-60, -80, -40, 20, 50, 40][f]
@@ -734,18 +970,17 @@ def sv_chain_whip_sheet():
         # Bass slung on back
         draw_sv_bass(d, cx + 8, cy + 5, 80)
     path = BOSS_DIR / "sid_vicious_chain_whip_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 def sv_punk_spit_sheet():
     """Punk spit projectile — 4 frames."""
     nf = 4
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
     for f in range(nf):
-        x_off = f * FW
-        cx = x_off + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         pose = {"torso_lean": [0, 2, 3, 1][f], "head_tilt": [0, 3, 4, 2][f],
                 "l_arm_angle": -20, "r_arm_angle": 15, "leg_spread": 5}
@@ -756,7 +991,7 @@ def sv_punk_spit_sheet():
             spit_dist = f * 8
             spit_x = cx + 8 + spit_dist
             spit_y = cy - 18
-            if spit_x < x_off + FW:
+            if spit_x < FW:
                 d.ellipse([spit_x - 2, spit_y - 2, spit_x + 2, spit_y + 2],
                           fill=SPIT_GREEN)
                 # Trail
@@ -764,17 +999,30 @@ def sv_punk_spit_sheet():
                     d.line([spit_x - 4, spit_y, spit_x - 1, spit_y],
                            fill=(*SPIT_GREEN, 120))
     path = BOSS_DIR / "sid_vicious_punk_spit_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
+
+
+@lru_cache(maxsize=1)
+def _shockwave_tiles():
+    """Stage-dive landing rings (flat 3:1 outlines), relative to their centre."""
+    o = 20
+    scratch = np.zeros((2 * o + 1, 2 * o + 1, 4), dtype=np.uint8)
+    d = ArrayDraw(scratch)
+    for ring_r in range(5, 20, 4):
+        d.ellipse([o - ring_r, o - ring_r // 3, o + ring_r, o + ring_r // 3],
+                  outline=(255, 255, 200, 100))
+    return _layer_tiles(scratch, o, o)
 
 
 def sv_stage_dive_sheet():
     """Stage dive charge — 6 frames."""
     nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
+    rng = sheet_rng("sid_vicious_stage_dive")
     for f in range(nf):
-        cx = f * FW + FW // 2
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
         # Crouch → leap → airborne → impact
         crouch = [0, -3, -6, -4, -1, 2][f]
@@ -787,119 +1035,208 @@ def sv_stage_dive_sheet():
         draw_sv_bass(d, cx + 8, cy + crouch + 5, 25 + lean * 2)
         # Impact shockwave on frame 5
         if f == 5:
-            for ring_r in range(5, 20, 4):
-                d.ellipse([cx - ring_r, cy + 30 - ring_r // 3,
-                          cx + ring_r, cy + 30 + ring_r // 3],
-                          outline=(255, 255, 200, 100))
+            _stamp_layer(d, cx, cy + 30, _shockwave_tiles())
         # Speed lines during dive (frames 2-4)
         if 2 <= f <= 4:
-            for _ in range(3):
-                sx = cx - 15 + random.randint(-5, 5)
-                sy = cy + crouch + random.randint(-10, 10)
-                d.line([sx, sy, sx - random.randint(5, 15), sy],
-                       fill=(*MOTION_BLUR, 80), width=1)
+            lxs = cx - 15 + rng.integers(-5, 5, 3, endpoint=True)
+            lys = cy + crouch + rng.integers(-10, 10, 3, endpoint=True)
+            draw_segments(frame, lxs, lys, lxs - rng.integers(5, 15, 3, endpoint=True), lys,
+                          as_rgba((*MOTION_BLUR, 80)))
     path = BOSS_DIR / "sid_vicious_stage_dive_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
+
+
+def _berserker_frame(f):
+    """(pose, bass_angle, blur_len) for berserker frame f."""
+    phase = math.sin(f * math.pi * 0.7)
+    pose = {"torso_lean": int(phase * 4), "head_tilt": int(phase * 3),
+            "l_arm_angle": -40 + int(phase * 25),
+            "r_arm_angle": 40 - int(phase * 25),
+            "leg_spread": 8}
+    return pose, int(phase * 50), int(phase * 8)
+
+
+SV_BERSERKER_FRAMES = tuple(_berserker_frame(f) for f in range(6))
 
 
 def sv_berserker_sheet():
     """Berserker rage — rapid alternating swings — 6 frames."""
-    nf = 6
-    img = Image.new("RGBA", (FW * nf, FH), (0, 0, 0, 0))
-    d = ImageDraw.Draw(img)
-    for f in range(nf):
-        x_off = f * FW
-        cx = x_off + FW // 2
+    nf = len(SV_BERSERKER_FRAMES)
+    arr = np.zeros((FH, FW * nf, 4), dtype=np.uint8)
+    rng = sheet_rng("sid_vicious_berserker")
+    for f, (pose, bass_angle, blur_len) in enumerate(SV_BERSERKER_FRAMES):
+        frame = arr[:, f * FW:(f + 1) * FW]
+        d = ArrayDraw(frame)
+        cx = FW // 2
         cy = FH // 2 + 5
-        phase = math.sin(f * math.pi * 0.7)
-        pose = {"torso_lean": int(phase * 4), "head_tilt": int(phase * 3),
-                "l_arm_angle": -40 + int(phase * 25),
-                "r_arm_angle": 40 - int(phase * 25),
-                "leg_spread": 8}
         pts = draw_sv_body(d, cx, cy, pose)
         # Bass swinging wildly
-        bass_angle = int(phase * 50)
         draw_sv_bass(d, pts["r_hand"][0], pts["r_hand"][1], bass_angle)
         # Rage aura (red glow)
-        for _ in range(6 + f * 2):
-            rx = cx + random.randint(-16, 16)
-            ry = cy + random.randint(-25, 25)
-            if x_off <= rx < x_off + FW and 0 <= ry < FH:
-                r0, g0, b0, a0 = img.getpixel((rx, ry))
-                if a0 > 0:
-                    img.putpixel((rx, ry), (min(r0 + 40, 255), max(g0 - 10, 0),
-                                              max(b0 - 10, 0), a0))
-                else:
-                    img.putpixel((rx, ry), (180, 30, 30, 30 + random.randint(0, 30)))
+        n_aura = 6 + f * 2
+        rxs = cx + rng.integers(-16, 16, n_aura, endpoint=True)
+        rys = cy + rng.integers(-25, 25, n_aura, endpoint=True)
+        glow = np.tile(RAGE_GLOW_RGBA, (n_aura, 1))
+        glow[:, 3] += rng.integers(0, 30, n_aura, endpoint=True).astype(np.uint8)
+        splatter(frame, rxs, rys, RAGE_BOOST, glow)
         # Motion blur streaks
-        for _ in range(3):
-            sx = cx + random.randint(-12, 12)
-            sy = cy + random.randint(-15, 15)
-            d.line([sx, sy, sx + int(phase * 8), sy], fill=(*MOTION_BLUR, 60), width=1)
+        lxs = cx + rng.integers(-12, 12, 3, endpoint=True)
+        lys = cy + rng.integers(-15, 15, 3, endpoint=True)
+        draw_segments(frame, lxs, lys, lxs + blur_len, lys, as_rgba((*MOTION_BLUR, 60)))
     path = BOSS_DIR / "sid_vicious_berserker_sheet.png"
-    img.save(path)
-    print(f"  [OK] {path.name}")
+    return save_sheet(arr, path)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  Palette-swap helpers
 # ══════════════════════════════════════════════════════════════════════════════
 
+def remap_with_palette(remap_fn, flat):
+    """Run remap_fn once per unique RGB in an (N, 4) buffer and gather the result.
+
+    Remaps depend only on RGB (alpha just gates pass-through), and sprite
+    sheets use a few hundred colours, so the branch work scales with the
+    palette instead of the pixel count. flat is overwritten and returned.
+    """
+    rgb = (flat[:, 0].astype(np.uint32) << 16) | (flat[:, 1].astype(np.uint32) << 8) | flat[:, 2]
+    _, first, inv = np.unique(rgb, return_index=True, return_inverse=True)
+    palette = flat[first].copy()
+    palette[:, 3] = 255
+    mapped = remap_fn(palette)
+    opaque = flat[:, 3] >= 10
+    flat[opaque, :3] = mapped[inv[opaque], :3]
+    return flat
+
+
 def swap_boss_sheets(remap_fn, prefix):
-    """Palette-swap Disco King sheets to a new boss."""
+    """Palette-swap Disco King sheets to a new boss.
+
+    remap_fn takes a (..., 4) uint8 pixel array and returns the remapped pixels.
+    Returns {stem: arr} for every sheet written.
+    """
     mappings = [
         ("disco_king_idle_sheet.png", f"{prefix}_idle_sheet.png"),
         ("disco_king_hurt_sheet.png", f"{prefix}_hurt_sheet.png"),
         ("disco_king_death_sheet.png", f"{prefix}_death_sheet.png"),
     ]
+    sheets = []
     for src_name, dst_name in mappings:
         src_path = BOSS_DIR / src_name
         if not src_path.exists():
             print(f"  [SKIP] {src_name} — not found")
             continue
-
-        img = Image.open(src_path).convert("RGBA")
-        px = np.array(img)
-        h, w, _ = px.shape
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[y, x]
-                px[y, x] = remap_fn(int(r), int(g), int(b), int(a))
-
+        sheets.append((dst_name, np.array(Image.open(src_path).convert("RGBA"))))
+    if not sheets:
+        return {}
+
+    # Remap every sheet's pixels in one pass over a single flat buffer
+    flat = remap_with_palette(remap_fn, np.concatenate([px.reshape(-1, 4) for _, px in sheets]))
+    splits = np.cumsum([px.shape[0] * px.shape[1] for _, px in sheets])[:-1]
+    saved = {}
+    for (dst_name, px), out in zip(sheets, np.split(flat, splits)):
         dst_path = BOSS_DIR / dst_name
-        Image.fromarray(px.astype(np.uint8), "RGBA").save(dst_path)
-        print(f"  [OK] {dst_name}")
+        saved.update(save_sheet(out.reshape(px.shape), dst_path))
+    return saved
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  Main
 # ══════════════════════════════════════════════════════════════════════════════
 
+# (group label, fn, args). Every sheet writes its own PNG and draws from its
+# own sheet_rng stream, so they can run in any order or in parallel with
+# identical output.
+JR_SWAP = "Johnny Rotten — palette-swap (from Disco King)"
+JR_ATTACKS = "Johnny Rotten — from-scratch attacks"
+SV_SWAP = "Sid Vicious — palette-swap (from Disco King)"
+SV_ATTACKS = "Sid Vicious — from-scratch attacks"
+SHEET_TASKS = [
+    (JR_SWAP, swap_boss_sheets, (remap_johnny_rotten, "johnny_rotten")),
+    (JR_ATTACKS, jr_sweep_sheet, ()),
+    (JR_ATTACKS, jr_feedback_sheet, ()),
+    (JR_ATTACKS, jr_pyro_sheet, ()),
+    (JR_ATTACKS, jr_chord_sheet, ()),
+    (JR_ATTACKS, jr_solo_sheet, ()),
+    (SV_SWAP, swap_boss_sheets, (remap_sid_vicious, "sid_vicious")),
+    (SV_ATTACKS, sv_bass_swing_sheet, ()),
+    (SV_ATTACKS, sv_chain_whip_sheet, ()),
+    (SV_ATTACKS, sv_punk_spit_sheet, ()),
+    (SV_ATTACKS, sv_stage_dive_sheet, ()),
+    (SV_ATTACKS, sv_berserker_sheet, ()),
+]
+
+
+def _run_task(index):
+    """Run SHEET_TASKS[index]; returns (printed output, saved sheets).
+
+    Picklable entry point for the process pool. Output is captured so the
+    parent can print it under the task's group header instead of
+    interleaving it with other workers.
+    """
+    _, fn, args = SHEET_TASKS[index]
+    log = io.StringIO()
+    with redirect_stdout(log):
+        saved = fn(*args)
+    return log.getvalue(), saved
+
+
+def _collect(results):
+    """Print task output under group headers in SHEET_TASKS order; merge the saved sheets."""
+    sheets = {}
+    group = None
+    for (label, _, _), (log, saved) in zip(SHEET_TASKS, results):
+        if label != group:
+            print(f"\n{label}:")
+            group = label
+        print(log, end="")
+        sheets.update(saved)
+    return sheets
+
+
+def write_atlas(prefix, sheets):
+    """Stack one boss's sheets into {prefix}_atlas.png plus a JSON manifest.
+
+    Sheets are stacked one animation per FH-tall row, in SHEET_TASKS order.
+    The manifest maps each animation name to its x, y, w, h and frame
+    count.
+    """
+    rows = [(stem[len(prefix) + 1:-len("_sheet")], arr)
+            for stem, arr in sheets.items() if stem.startswith(prefix + "_")]
+    atlas = np.zeros((FH * len(rows), max(arr.shape[1] for _, arr in rows), 4), np.uint8)
+    manifest = {}
+    for i, (anim, arr) in enumerate(rows):
+        atlas[i * FH:(i + 1) * FH, :arr.shape[1]] = arr
+        manifest[anim] = {"x": 0, "y": i * FH, "w": arr.shape[1], "h": FH,
+                          "frames": arr.shape[1] // FW}
+    save_sheet(atlas, BOSS_DIR / f"{prefix}_atlas.png")
+    (BOSS_DIR / f"{prefix}_atlas.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    print(f"  [OK] {prefix}_atlas.json ({len(rows)} animations)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate Sex Pistols Concert boss sprites")
+    parser.add_argument("--serial", action="store_true",
+                        help="Build sheets one at a time in this process")
+    parser.add_argument("--atlas", action="store_true",
+                        help="Also pack each boss's sheets into one atlas PNG + JSON")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     print("Generating Sex Pistols Concert boss sprites...")
 
-    # ── Johnny Rotten ──
-    print("\nJohnny Rotten — palette-swap (from Disco King):")
-    swap_boss_sheets(remap_johnny_rotten, "johnny_rotten")
-
-    print("\nJohnny Rotten — from-scratch attacks:")
-    jr_sweep_sheet()
-    jr_feedback_sheet()
-    jr_pyro_sheet()
-    jr_chord_sheet()
-    jr_solo_sheet()
-
-    # ── Sid Vicious ──
-    print("\nSid Vicious — palette-swap (from Disco King):")
-    swap_boss_sheets(remap_sid_vicious, "sid_vicious")
-
-    print("\nSid Vicious — from-scratch attacks:")
-    sv_bass_swing_sheet()
-    sv_chain_whip_sheet()
-    sv_punk_spit_sheet()
-    sv_stage_dive_sheet()
-    sv_berserker_sheet()
+    indices = range(len(SHEET_TASKS))
+    if args.serial:
+        sheets = _collect(map(_run_task, indices))
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(SHEET_TASKS), os.cpu_count() or 1)) as ex:
+            sheets = _collect(ex.map(_run_task, indices))
+
+    if args.atlas:
+        print("\nAtlases:")
+        for prefix in ("johnny_rotten", "sid_vicious"):
+            write_atlas(prefix, sheets)
 
     print("\nDone! 16 Sex Pistols boss sprites generated (8 each).")
 
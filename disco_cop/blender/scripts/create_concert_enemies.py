@@ -10,92 +10,82 @@ From-scratch enemies:
   - Speaker Stack (30x50/frame): Marshall-style amp cabinet
 
 Usage:
-    python create_concert_enemies.py
+    python create_concert_enemies.py [--serial]
 """
 
-import random
+import argparse
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 from PIL import Image, ImageDraw
 
+from _lut_remap import LEVELS, build_lut, lut_column, remap_sheet_nb
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 ENEMY_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "enemies"
 
-random.seed(303)
-
-# ── Palette-swap remap functions ──────────────────────────────────────────────
-
-
-def remap_groupie(r, g, b, a):
-    """Shooter → Groupie: hot pink/magenta concert fan outfit."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 130:
-        # Light body → hot pink top
-        return (min(int(r * 1.3), 240), max(int(g * 0.4), 40), min(int(b * 1.1), 180), a)
-    elif is_gray and brightness > 80:
-        # Mid body → magenta/purple skirt
-        return (min(int(r * 1.1), 200), max(int(g * 0.3), 30), min(int(b * 1.3), 210), a)
-    elif brightness > 100 and r > g:
-        # Warm accents → neon pink highlights
-        return (min(int(r * 1.4), 255), max(int(g * 0.3), 50), min(int(b * 1.2), 200), a)
-    elif brightness > 50:
-        # Mid tones → warm skin tone
-        return (min(int(r * 1.2), 200), min(int(g * 0.9), 150), max(int(b * 0.7), 80), a)
-    else:
-        # Dark (outlines, hair) → keep dark with slight pink
-        return (min(r + 15, 80), g, min(b + 10, 60), a)
-
-
-def remap_pyrotech(r, g, b, a):
-    """Shooter → Pyro Tech: orange/red hazmat fire crew."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 130:
-        # Light body → bright orange hazmat
-        return (min(int(r * 1.4), 255), min(int(g * 0.8), 160), max(int(b * 0.2), 10), a)
-    elif is_gray and brightness > 80:
-        # Mid body → darker orange/red
-        return (min(int(r * 1.3), 220), max(int(g * 0.5), 60), max(int(b * 0.2), 10), a)
-    elif brightness > 100 and r > g:
-        # Warm accents → yellow safety stripes
-        return (min(int(r * 1.3), 255), min(int(g * 1.2), 230), max(int(b * 0.3), 20), a)
-    elif brightness > 50:
-        # Mid tones → red-tinted skin
-        return (min(int(r * 1.3), 210), min(int(g * 0.8), 130), max(int(b * 0.5), 50), a)
-    else:
-        # Dark (outlines) → deep red-brown
-        return (min(r + 20, 90), min(g + 5, 40), b, a)
-
-
-def swap_sheets(src_names, prefix, remap_fn):
-    """Apply remap function to source sheets, save with new prefix."""
+# Seed for the speaker sheets' spark stream; each sheet task owns its own
+# generator so tasks can run in any order or in parallel.
+SPEAKER_SEED = 303
+
+# ── Palette-swap remap LUTs ───────────────────────────────────────────────────
+#
+# One (r, g, b) column triple per case, in _lut_remap's CASE_* order.
+
+# Shooter → Groupie: hot pink/magenta concert fan outfit.
+GROUPIE_LUT = build_lut([
+    # Light body → hot pink top
+    (lut_column(1.3, hi=240), lut_column(0.4, lo=40), lut_column(1.1, hi=180)),
+    # Mid body → magenta/purple skirt
+    (lut_column(1.1, hi=200), lut_column(0.3, lo=30), lut_column(1.3, hi=210)),
+    # Warm accents → neon pink highlights
+    (lut_column(1.4, hi=255), lut_column(0.3, lo=50), lut_column(1.2, hi=200)),
+    # Mid tones → warm skin tone
+    (lut_column(1.2, hi=200), lut_column(0.9, hi=150), lut_column(0.7, lo=80)),
+    # Dark (outlines, hair) → keep dark with slight pink
+    (np.minimum(LEVELS + 15, 80), LEVELS, np.minimum(LEVELS + 10, 60)),
+])
+
+# Shooter → Pyro Tech: orange/red hazmat fire crew.
+PYROTECH_LUT = build_lut([
+    # Light body → bright orange hazmat
+    (lut_column(1.4, hi=255), lut_column(0.8, hi=160), lut_column(0.2, lo=10)),
+    # Mid body → darker orange/red
+    (lut_column(1.3, hi=220), lut_column(0.5, lo=60), lut_column(0.2, lo=10)),
+    # Warm accents → yellow safety stripes
+    (lut_column(1.3, hi=255), lut_column(1.2, hi=230), lut_column(0.3, lo=20)),
+    # Mid tones → red-tinted skin
+    (lut_column(1.3, hi=210), lut_column(0.8, hi=130), lut_column(0.5, lo=50)),
+    # Dark (outlines) → deep red-brown
+    (np.minimum(LEVELS + 20, 90), np.minimum(LEVELS + 5, 40), LEVELS),
+])
+
+
+def swap_sheets(src_names, prefix, lut):
+    """Apply a palette LUT to source sheets, save with new prefix.
+
+    lut: (5, 3, 256) uint8 per-case channel table (see build_lut).
+    """
     for src_name in src_names:
         src_path = ENEMY_DIR / src_name
         if not src_path.exists():
             print(f"  [SKIP] {src_name} — not found")
             continue
 
-        img = Image.open(src_path).convert("RGBA")
-        px = np.array(img)
-        h, w, _ = px.shape
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[y, x]
-                px[y, x] = remap_fn(int(r), int(g), int(b), int(a))
+        # Each pixel is read before it is written, so remap in place
+        px = np.array(Image.open(src_path).convert("RGBA"))
+        remap_sheet_nb(px, px, lut)
 
         base = src_name.split("_", 1)[1]  # Remove first word
         dst_name = f"{prefix}_{base}"
         dst_path = ENEMY_DIR / dst_name
-        Image.fromarray(px.astype(np.uint8), "RGBA").save(dst_path)
+        Image.fromarray(px, "RGBA").save(dst_path)
         print(f"  [OK] {dst_name}")
 
 
@@ -124,10 +114,23 @@ SPEAKER_GOLD_LIGHT = (240, 210, 80)
 SPEAKER_CONE = (45, 45, 50)
 SPEAKER_CONE_CENTER = (35, 35, 40)
 
+CLEAR = (0, 0, 0, 0)
 
-def draw_roadie_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
-    """Draw a single roadie frame at given offset. 30x55."""
-    d = ImageDraw.Draw(img)
+# Per-frame (left, right) limb offsets, indexed by frame % 4
+ROADIE_WALK_LEGS = ((-3, 3), (3, -3), (-2, 2), (2, -2))
+ROADIE_WALK_ARMS = ((-2, 2), (2, -2), (-1, 1), (1, -1))
+ROADIE_CHARGE_LEGS = ((-4, 4), (4, -4), (-3, 3), (3, -3))
+ROADIE_CHARGE_ARMS = ((-4, 3), (3, -4), (-3, 2), (2, -3))
+ROADIE_HURT_ARMS = ((2, -2), (-2, 2))  # first frame, then the rest
+
+# Speaker cabinet vibration offsets
+SPEAKER_WALK_VIB_X = (0, 1)  # indexed by frame % 2
+SPEAKER_ATTACK_VIB_X = (-1, 1, -1, 1)  # indexed by frame % 4
+SPEAKER_ATTACK_VIB_Y = (-1, 0, 1, 0)
+
+
+def draw_roadie_frame(d, x_off, y_off, fw, fh, pose="stand", frame=0):
+    """Draw a single roadie frame at given offset with Draw d. 30x55."""
     cx = x_off + fw // 2  # center x
     # Vertical offsets (from top of frame)
     head_y = y_off + 3
@@ -137,17 +140,15 @@ def draw_roadie_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
 
     # Walk/charge leg offsets
     if pose == "walk":
-        leg_offsets = [(-3, 3), (3, -3), (-2, 2), (2, -2)]
-        lo = leg_offsets[frame % 4]
-        arm_swing = [(-2, 2), (2, -2), (-1, 1), (1, -1)]
-        ao = arm_swing[frame % 4]
+        lo = ROADIE_WALK_LEGS[frame % 4]
+        ao = ROADIE_WALK_ARMS[frame % 4]
     elif pose == "charge":
         # Leaning forward, arms out
-        lo = [(-4, 4), (4, -4), (-3, 3), (3, -3)][frame % 4]
-        ao = [(-4, 3), (3, -4), (-3, 2), (2, -3)][frame % 4]
+        lo = ROADIE_CHARGE_LEGS[frame % 4]
+        ao = ROADIE_CHARGE_ARMS[frame % 4]
     elif pose == "hurt":
         lo = (0, 0)
-        ao = (2, -2) if frame == 0 else (-2, 2)
+        ao = ROADIE_HURT_ARMS[frame != 0]
     elif pose == "death":
         # Progressive collapse
         collapse = min(frame, 3)
@@ -210,11 +211,11 @@ def draw_roadie_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
         d.rectangle([cx - 6, hip_y, cx + 6, hip_y + 4], fill=ROADIE_JEANS)
     else:
         # Left leg
-        ll_x = cx - 4 + (lo[0] if isinstance(lo, tuple) else lo)
+        ll_x = cx - 4 + lo[0]
         d.rectangle([ll_x - leg_w // 2, hip_y, ll_x + leg_w // 2, foot_y],
                     fill=ROADIE_JEANS, outline=ROADIE_JEANS_DARK)
         # Right leg
-        rl_x = cx + 4 + (lo[1] if isinstance(lo, tuple) else 0)
+        rl_x = cx + 4 + lo[1]
         d.rectangle([rl_x - leg_w // 2, hip_y, rl_x + leg_w // 2, foot_y],
                     fill=ROADIE_JEANS, outline=ROADIE_JEANS_DARK)
 
@@ -242,21 +243,38 @@ def create_roadie_sheets():
         "roadie_death_sheet.png": ("death", 4),
     }
 
+    # One canvas sized for the longest sheet, cleared and cropped per sheet
+    max_frames = max(nframes for _, nframes in sheets.values())
+    img = Image.new("RGBA", (fw * max_frames, fh), CLEAR)
+    d = ImageDraw.Draw(img)
     for name, (pose, nframes) in sheets.items():
-        img = Image.new("RGBA", (fw * nframes, fh), (0, 0, 0, 0))
+        img.paste(CLEAR, (0, 0, img.width, fh))
         for f in range(nframes):
-            draw_roadie_frame(img, f * fw, 0, fw, fh, pose, f)
+            draw_roadie_frame(d, f * fw, 0, fw, fh, pose, f)
         path = ENEMY_DIR / name
-        img.save(path)
+        img.crop((0, 0, fw * nframes, fh)).save(path)
         print(f"  [OK] {name}")
 
 
+@lru_cache(maxsize=8)
+def _grille_masks(w, h, phase):
+    """1-bit masks of the dark and light grille dots for a w x h grille.
+
+    Dots sit on odd offsets; a dot is dark when its absolute (gx + gy) is a
+    multiple of 4, so the split depends on phase = (x + y) % 4 of the corner.
+    """
+    gy, gx = np.mgrid[0:h, 0:w]
+    dot = (gx % 2 == 1) & (gy % 2 == 1)
+    dark = (gx + gy + phase) % 4 == 0
+    return (Image.fromarray(dot & dark).convert("1"),
+            Image.fromarray(dot & ~dark).convert("1"))
+
+
 def draw_speaker_grille(d, x, y, w, h):
     """Draw speaker grille pattern (dotted grid)."""
-    for gy in range(y + 1, y + h, 2):
-        for gx in range(x + 1, x + w, 2):
-            c = SPEAKER_GRILLE if (gx + gy) % 4 == 0 else SPEAKER_GRILLE_LIGHT
-            d.point([gx, gy], fill=c)
+    dark, light = _grille_masks(w, h, (x + y) % 4)
+    d.bitmap((x, y), dark, fill=SPEAKER_GRILLE)
+    d.bitmap((x, y), light, fill=SPEAKER_GRILLE_LIGHT)
 
 
 def draw_speaker_cone(d, cx, cy, radius):
@@ -269,18 +287,46 @@ def draw_speaker_cone(d, cx, cy, radius):
               fill=SPEAKER_CONE_CENTER, outline=SPEAKER_DARK)
 
 
-def draw_speaker_frame(img, x_off, y_off, fw, fh, pose="idle", frame=0):
-    """Draw a single speaker stack frame. 30x50."""
-    d = ImageDraw.Draw(img)
+@lru_cache(maxsize=4)
+def _cone_grid_masks(bw, cone_r):
+    """The cabinet's 2x2 cone grid, rendered once, as (1-bit mask, colour) layers.
+
+    Masks are relative to the cabinet's top-left corner; each colour is one
+    d.bitmap instead of two ellipses per cone.
+    """
+    grid = Image.new("RGBA", (bw + cone_r + 1, 32 + cone_r + 1), CLEAR)
+    d = ImageDraw.Draw(grid)
+    for cone_y in (18, 32):
+        for cone_x in (bw // 4, 3 * bw // 4):
+            draw_speaker_cone(d, cone_x, cone_y, cone_r)
+    px = np.array(grid)
+    colors = np.unique(px[px[..., 3] > 0], axis=0)
+    return tuple((Image.fromarray((px == c).all(axis=-1)).convert("1"), tuple(int(v) for v in c))
+                 for c in colors)
+
+
+@lru_cache(maxsize=8)
+def _ring_mask(r):
+    """1-bit mask of a 1px circle of radius r, drawn once per radius."""
+    mask = Image.new("1", (2 * r + 1, 2 * r + 1), 0)
+    ImageDraw.Draw(mask).arc([0, 0, 2 * r, 2 * r], 0, 360, fill=1, width=1)
+    return mask
+
+
+def draw_speaker_frame(d, img, rng, x_off, y_off, fw, fh, pose="idle", frame=0):
+    """Draw a single speaker stack frame into img with its Draw d. 30x50.
+
+    rng: np.random.Generator for the death-frame sparks.
+    """
 
     # Vibration offset for idle
     vib_x = 0
     vib_y = 0
     if pose == "walk":
-        vib_x = [0, 1, 0, -1][frame % 2]
+        vib_x = SPEAKER_WALK_VIB_X[frame % 2]
     elif pose == "attack":
-        vib_x = [-1, 1, -1, 1][frame % 4]
-        vib_y = [-1, 0, 1, 0][frame % 4]
+        vib_x = SPEAKER_ATTACK_VIB_X[frame % 4]
+        vib_y = SPEAKER_ATTACK_VIB_Y[frame % 4]
 
     bx = x_off + 2 + vib_x
     by = y_off + 2 + vib_y
@@ -294,20 +340,13 @@ def draw_speaker_frame(img, x_off, y_off, fw, fh, pose="idle", frame=0):
     d.rectangle([bx + 2, by + 2, bx + bw - 2, by + 8], fill=SPEAKER_DARK)
     # Gold "MARSHALL" logo
     logo_y = by + 4
-    for lx in range(bx + 6, bx + bw - 6, 2):
-        d.point([lx, logo_y], fill=SPEAKER_GOLD)
-        d.point([lx, logo_y - 1], fill=SPEAKER_GOLD_LIGHT)
+    logo_xs = range(bx + 6, bx + bw - 6, 2)
+    d.point([(lx, logo_y) for lx in logo_xs], fill=SPEAKER_GOLD)
+    d.point([(lx, logo_y - 1) for lx in logo_xs], fill=SPEAKER_GOLD_LIGHT)
 
     # ── Speaker cones (2x2 grid) ──
-    cone_r = 4
-    cx1 = bx + bw // 4
-    cx2 = bx + 3 * bw // 4
-    cy1 = by + 18
-    cy2 = by + 32
-    draw_speaker_cone(d, cx1, cy1, cone_r)
-    draw_speaker_cone(d, cx2, cy1, cone_r)
-    draw_speaker_cone(d, cx1, cy2, cone_r)
-    draw_speaker_cone(d, cx2, cy2, cone_r)
+    for mask, color in _cone_grid_masks(bw, 4):
+        d.bitmap((bx, by), mask, fill=color)
 
     # ── Grille cloth around cones ──
     draw_speaker_grille(d, bx + 2, by + 10, bw - 4, bh - 14)
@@ -327,8 +366,7 @@ def draw_speaker_frame(img, x_off, y_off, fw, fh, pose="idle", frame=0):
         for ring in range(1, frame + 1):
             r = 8 + ring * 6
             alpha = max(60, 200 - ring * 50)
-            d.arc([ring_cx - r, ring_cy - r, ring_cx + r, ring_cy + r],
-                  0, 360, fill=(200, 200, 255, alpha), width=1)
+            d.bitmap((ring_cx - r, ring_cy - r), _ring_mask(r), fill=(200, 200, 255, alpha))
 
     # ── Hurt: flash ──
     if pose == "hurt":
@@ -346,18 +384,16 @@ def draw_speaker_frame(img, x_off, y_off, fw, fh, pose="idle", frame=0):
             d.line([bx + 4, by + bh // 3, bx + bw - 4, by + 2 * bh // 3],
                    fill=SPEAKER_GRILLE_LIGHT, width=1)
             # Spark pixels
-            for _ in range(3):
-                sx = bx + random.randint(2, bw - 2)
-                sy = by + random.randint(2, bh - 2)
-                d.point([sx, sy], fill=SPEAKER_GOLD_LIGHT)
+            spark_xs = bx + rng.integers(2, bw - 2, 3, endpoint=True)
+            spark_ys = by + rng.integers(2, bh - 2, 3, endpoint=True)
+            d.point(list(zip(spark_xs.tolist(), spark_ys.tolist())), fill=SPEAKER_GOLD_LIGHT)
         if frame >= 3:
-            # Fading / darkening
-            for fy in range(by + bh // 2, by + bh):
-                for fx in range(bx, bx + bw):
-                    if 0 <= fx < img.width and 0 <= fy < img.height:
-                        pr, pg, pb, pa = img.getpixel((fx, fy))
-                        if pa > 0:
-                            img.putpixel((fx, fy), (pr // 2, pg // 2, pb // 2, pa))
+            # Fading / darkening: halve RGB of the drawn pixels in the lower half
+            box = (max(bx, 0), max(by + bh // 2, 0),
+                   min(bx + bw, img.width), min(by + bh, img.height))
+            px = np.array(img.crop(box))
+            px[px[..., 3] > 0, :3] >>= 1
+            img.paste(Image.fromarray(px, "RGBA"), box)
 
 
 def create_speaker_sheets():
@@ -371,46 +407,79 @@ def create_speaker_sheets():
         "speaker_death_sheet.png": ("death", 4),
     }
 
+    # One canvas sized for the longest sheet, cleared and cropped per sheet
+    max_frames = max(nframes for _, nframes in sheets.values())
+    img = Image.new("RGBA", (fw * max_frames, fh), CLEAR)
+    d = ImageDraw.Draw(img)
+    rng = np.random.default_rng(SPEAKER_SEED)
     for name, (pose, nframes) in sheets.items():
-        img = Image.new("RGBA", (fw * nframes, fh), (0, 0, 0, 0))
+        img.paste(CLEAR, (0, 0, img.width, fh))
         for f in range(nframes):
-            draw_speaker_frame(img, f * fw, 0, fw, fh, pose, f)
+            draw_speaker_frame(d, img, rng, f * fw, 0, fw, fh, pose, f)
         path = ENEMY_DIR / name
-        img.save(path)
+        img.crop((0, 0, fw * nframes, fh)).save(path)
         print(f"  [OK] {name}")
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
 
 
+SHOOTER_SHEETS = [
+    "shooter_skate_sheet.png",
+    "shooter_shoot_skate_sheet.png",
+    "shooter_hurt_sheet.png",
+    "shooter_death_sheet.png",
+]
+
+# (label, fn, args). Every task writes its own PNGs and owns its RNG, so
+# they can run in any order or in parallel with identical output.
+SHEET_TASKS = [
+    ("Groupie (palette-swap from shooter)", swap_sheets, (SHOOTER_SHEETS, "groupie", GROUPIE_LUT)),
+    ("Pyro Tech (palette-swap from shooter)", swap_sheets,
+     (SHOOTER_SHEETS, "pyrotech", PYROTECH_LUT)),
+    ("Roadie (from scratch)", create_roadie_sheets, ()),
+    ("Speaker Stack (from scratch)", create_speaker_sheets, ()),
+]
+
+
+def _run_task(index):
+    """Run SHEET_TASKS[index] and return what it printed.
+
+    Picklable entry point for the process pool. Output is captured so the
+    parent can print it under the task's header instead of interleaving
+    it with other workers.
+    """
+    _, fn, args = SHEET_TASKS[index]
+    log = io.StringIO()
+    with redirect_stdout(log):
+        fn(*args)
+    return log.getvalue()
+
+
+def _print_logs(logs):
+    """Print each task's captured output under its label, in SHEET_TASKS order."""
+    for (label, _, _), log in zip(SHEET_TASKS, logs):
+        print(f"\n{label}:")
+        print(log, end="")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate Led Zeppelin Concert enemy sprites")
+    parser.add_argument("--serial", action="store_true",
+                        help="Build sheets one at a time in this process")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     print("Generating Led Zeppelin Concert enemy sprites...")
 
-    # Palette-swap: Groupie (from shooter)
-    print("\nGroupie (palette-swap from shooter):")
-    swap_sheets([
-        "shooter_skate_sheet.png",
-        "shooter_shoot_skate_sheet.png",
-        "shooter_hurt_sheet.png",
-        "shooter_death_sheet.png",
-    ], "groupie", remap_groupie)
-
-    # Palette-swap: Pyro Tech (from shooter)
-    print("\nPyro Tech (palette-swap from shooter):")
-    swap_sheets([
-        "shooter_skate_sheet.png",
-        "shooter_shoot_skate_sheet.png",
-        "shooter_hurt_sheet.png",
-        "shooter_death_sheet.png",
-    ], "pyrotech", remap_pyrotech)
-
-    # From-scratch: Roadie
-    print("\nRoadie (from scratch):")
-    create_roadie_sheets()
-
-    # From-scratch: Speaker Stack
-    print("\nSpeaker Stack (from scratch):")
-    create_speaker_sheets()
+    indices = range(len(SHEET_TASKS))
+    if args.serial:
+        _print_logs(map(_run_task, indices))
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(SHEET_TASKS), os.cpu_count() or 1)) as ex:
+            _print_logs(ex.map(_run_task, indices))
 
     print("\nDone! 16 concert enemy sprites generated.")
 
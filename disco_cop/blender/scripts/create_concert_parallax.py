@@ -14,16 +14,23 @@ Usage:
 """
 
 import math
-import random
+import os
+from functools import lru_cache
 from pathlib import Path
+
+import numpy as np
+from numba import njit
 from PIL import Image, ImageDraw
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "environment"
 
+# Fast zlib level while iterating on art; set DISCO_RELEASE_ASSETS=1 to ship.
+PNG_COMPRESS_LEVEL = 9 if os.environ.get("DISCO_RELEASE_ASSETS") else 1
+
 W, H = 640, 360
-random.seed(505)
+RNG = np.random.default_rng(505)
 
 # Concert palette
 CEILING_TOP = (5, 3, 8)
@@ -66,6 +73,7 @@ PYRO_BASE = (50, 45, 40)
 PYRO_FLAME_1 = (255, 160, 20)
 PYRO_FLAME_2 = (255, 100, 10)
 PYRO_FLAME_3 = (255, 60, 5)
+PYRO_GLOW_ADD = np.array([30, 15])  # red, green lift on the floor below a pot
 MIC_CHROME = (180, 185, 195)
 MIC_BLACK = (30, 30, 35)
 
@@ -82,51 +90,70 @@ def draw_truss_segment(d, x1, y, x2, truss_h=8):
         d.line([x, y + 1, end_x, y + truss_h - 2], fill=TRUSS_LIGHT, width=1)
         d.line([x, y + truss_h - 2, end_x, y + 1], fill=TRUSS_LIGHT, width=1)
     # Highlight on top rail
-    for x in range(x1, x2, 3):
-        if random.random() < 0.2:
-            d.point([x, y], fill=TRUSS_CHROME)
-
-
-def draw_spot_light(img, x, y, color, beam_angle=15, beam_len=120):
-    """Draw a spot light fixture with beam cone."""
-    d = ImageDraw.Draw(img)
+    xs = np.arange(x1, x2, 3)
+    lit = xs[RNG.random(xs.size) < 0.2]
+    d.point([(x, y) for x in lit.tolist()], fill=TRUSS_CHROME)
+
+
+def beam_profile(beam_angle, beam_len):
+    """Half-width and alpha of each beam row, from 10px below the lens down."""
+    dists = np.arange(10, beam_len)
+    widths = (dists * math.tan(math.radians(beam_angle))).astype(np.int64)
+    t = dists / beam_len
+    alphas = np.maximum(2, (40 * (1 - t * t)).astype(np.int64))
+    return widths, alphas
+
+
+@njit(cache=True)
+def blend_beam(arr, x, y, rgb, widths, alphas):
+    """Add the beam cone of a spot light whose fixture sits at (x, y) in arr.
+
+    Row i lies 18 + i px below the fixture top, spans x +- widths[i] and
+    adds rgb scaled by alphas[i] with saturation (see beam_profile).
+    Pixels outside arr are skipped.
+    """
+    h, w = arr.shape[0], arr.shape[1]
+    rgb_max = max(rgb[0], rgb[1], rgb[2])
+    for i in range(min(widths.size, h - y - 18)):
+        beam_y = y + 18 + i
+        width = widths[i]
+        alpha = alphas[i]
+        blend = alpha / 255.0
+        if rgb_max * blend * 0.4 < 1.0:
+            # Faded tail: every channel's add truncates away, only alpha can rise
+            for bx in range(max(x - width, 0), min(x + width + 1, w)):
+                arr[beam_y, bx, 3] = max(arr[beam_y, bx, 3], alpha)
+            continue
+        for bx in range(max(x - width, 0), min(x + width + 1, w)):
+            for c in range(3):
+                arr[beam_y, bx, c] = min(int(arr[beam_y, bx, c] + rgb[c] * blend * 0.4), 255)
+            arr[beam_y, bx, 3] = max(arr[beam_y, bx, 3], alpha)
+
+
+def draw_spot_fixture(d, x, y, color):
+    """Draw a spot light fixture; its beam is added later by blend_beam."""
     # Fixture housing
     d.rectangle([x - 3, y, x + 3, y + 5], fill=TRUSS_DARK)
     d.rectangle([x - 4, y + 5, x + 4, y + 8], fill=color)
     # Lens glow
     d.ellipse([x - 2, y + 5, x + 2, y + 9], fill=color)
 
-    # Light beam (cone of semi-transparent color)
-    angle_rad = math.radians(beam_angle)
-    for dist in range(10, beam_len):
-        t = dist / beam_len
-        width = int(dist * math.tan(angle_rad))
-        alpha = max(2, int(40 * (1 - t * t)))
-        beam_y = y + 8 + dist
-        if beam_y >= H:
-            break
-        for bx in range(x - width, x + width + 1):
-            if 0 <= bx < W:
-                r0, g0, b0, a0 = img.getpixel((bx, beam_y))
-                blend = alpha / 255.0
-                nr = min(int(r0 + color[0] * blend * 0.4), 255)
-                ng = min(int(g0 + color[1] * blend * 0.4), 255)
-                nb = min(int(b0 + color[2] * blend * 0.4), 255)
-                img.putpixel((bx, beam_y), (nr, ng, nb, max(a0, alpha)))
-
 
 def create_sky_layer():
-    """Far: dark ceiling, lighting truss grid, spot lights, crowd mass."""
-    img = Image.new("RGBA", (W, H), (0, 0, 0, 255))
-    d = ImageDraw.Draw(img)
+    """Far: dark ceiling, lighting truss grid, spot lights, crowd mass.
 
+    Shapes are drawn with ImageDraw first; the additive light passes (beams,
+    haze, phone glows) then run on a single array copy of the layer.
+    """
     # ── Dark ceiling gradient ──
-    for y in range(H):
-        t = y / H
-        r = int(CEILING_TOP[0] * (1 - t) + CEILING_LOW[0] * t)
-        g = int(CEILING_TOP[1] * (1 - t) + CEILING_LOW[1] * t)
-        b = int(CEILING_TOP[2] * (1 - t) + CEILING_LOW[2] * t)
-        d.line([0, y, W - 1, y], fill=(r, g, b, 255))
+    # One colour per row, broadcast across the width in a single fill
+    t = (np.arange(H) / H)[:, None]
+    rows = (np.array(CEILING_TOP) * (1 - t) + np.array(CEILING_LOW) * t).astype(np.uint8)
+    arr = np.empty((H, W, 4), dtype=np.uint8)
+    arr[..., :3] = rows[:, None]
+    arr[..., 3] = 255
+    img = Image.fromarray(arr, "RGBA")
+    d = ImageDraw.Draw(img)
 
     # ── Lighting truss grid ──
     # Main horizontal trusses
@@ -149,66 +176,89 @@ def create_sky_layer():
         (320, 78, SPOT_AMBER, 10, 110),
         (440, 78, SPOT_BLUE, 9, 105),
     ]
-    for sx, sy, color, angle, length in spot_configs:
-        draw_spot_light(img, sx, sy, color, angle, length)
-
-    # ── Haze / atmosphere (subtle fog layer) ──
-    for y in range(100, 200):
-        t = (y - 100) / 100
-        haze_alpha = int(15 * math.sin(t * math.pi))
-        for x in range(0, W, 2):
-            r0, g0, b0, _ = img.getpixel((x, y))
-            nr = min(r0 + haze_alpha, 255)
-            ng = min(g0 + haze_alpha, 255)
-            nb = min(b0 + haze_alpha + 2, 255)
-            img.putpixel((x, y), (nr, ng, nb, 255))
+    for sx, sy, color, _, _ in spot_configs:
+        draw_spot_fixture(d, sx, sy, color)
 
     # ── Crowd silhouette mass (bottom third) ──
     crowd_top = 240
     d.rectangle([0, crowd_top, W - 1, H - 1], fill=CROWD_MASS)
 
     # Individual head bumps along crowd top
-    for hx in range(0, W, 5):
-        hy = crowd_top - random.randint(0, 12)
-        hw = random.randint(3, 5)
-        hh = random.randint(4, 7)
+    hxs = range(0, W, 5)
+    hys = crowd_top - RNG.integers(0, 12, len(hxs), endpoint=True)
+    hws = RNG.integers(3, 5, len(hxs), endpoint=True)
+    hhs = RNG.integers(4, 7, len(hxs), endpoint=True)
+    for hx, hy, hw, hh in zip(hxs, hys.tolist(), hws.tolist(), hhs.tolist()):
         d.ellipse([hx, hy, hx + hw, hy + hh], fill=CROWD_HEAD)
         # Body below
         d.rectangle([hx - 1, hy + hh, hx + hw + 1, crowd_top + 10], fill=CROWD_MASS)
 
     # Raised arms
-    for _ in range(25):
-        ax = random.randint(10, W - 10)
-        ay = crowd_top - random.randint(8, 25)
-        arm_h = random.randint(10, 20)
+    axs = RNG.integers(10, W - 10, 25, endpoint=True)
+    ays = crowd_top - RNG.integers(8, 25, 25, endpoint=True)
+    arm_hs = RNG.integers(10, 20, 25, endpoint=True)
+    for ax, ay, arm_h in zip(axs.tolist(), ays.tolist(), arm_hs.tolist()):
         d.line([ax, ay + arm_h, ax, ay], fill=CROWD_ARM, width=1)
         # Fist/hand at top
         d.rectangle([ax - 1, ay - 1, ax + 1, ay + 1], fill=CROWD_ARM)
 
-    # Phone screen glows in crowd
-    for _ in range(15):
-        px = random.randint(5, W - 5)
-        py = random.randint(crowd_top + 5, H - 10)
-        glow = random.choice([CROWD_PHONE, (200, 180, 255), (180, 255, 200)])
-        d.rectangle([px, py, px + 1, py + 2], fill=glow)
-        # Glow halo
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = px + dx, py + dy
-                if 0 <= nx < W and 0 <= ny < H:
-                    r0, g0, b0, _ = img.getpixel((nx, ny))
-                    nr = min(r0 + glow[0] // 10, 255)
-                    ng = min(g0 + glow[1] // 10, 255)
-                    nb = min(b0 + glow[2] // 10, 255)
-                    img.putpixel((nx, ny), (nr, ng, nb, 255))
+    # ── Light passes on the layer's pixels ──
+    arr = np.array(img)
+
+    # Spot light beams (cones of semi-transparent color below each fixture)
+    for sx, sy, color, angle, length in spot_configs:
+        blend_beam(arr, sx, sy, np.array(color), *beam_profile(angle, length))
+
+    # Haze / atmosphere (subtle fog layer): rows 100-199, every other
+    # column; blue gets 2 extra
+    haze_alpha = (15 * np.sin(np.arange(100) / 100 * np.pi)).astype(int)
+    haze = haze_alpha[:, None, None] + np.array([0, 0, 2])
+    cols = arr[100:200, ::2]
+    cols[..., :3] = np.minimum(cols[..., :3] + haze, 255)
+    cols[..., 3] = 255
+
+    # Phone screen glows in crowd. Screens sit at least 4px inside the
+    # layer, so halos never need clipping.
+    halo = np.ones((3, 3), dtype=bool)
+    halo[1, 1] = False
+    glows = [CROWD_PHONE, (200, 180, 255), (180, 255, 200)]
+    pxs = RNG.integers(5, W - 5, 15, endpoint=True)
+    pys = RNG.integers(crowd_top + 5, H - 10, 15, endpoint=True)
+    picks = RNG.integers(0, len(glows), 15)
+    for px, py, pick in zip(pxs.tolist(), pys.tolist(), picks.tolist()):
+        glow = glows[pick]
+        arr[py:py + 3, px:px + 2] = (*glow, 255)
+        # Glow halo on the 8 neighbours of the screen's top-left pixel
+        cell = arr[py - 1:py + 2, px - 1:px + 2]
+        cell[halo, :3] = np.minimum(cell[halo, :3] + np.array(glow) // 10, 255)
+        cell[halo, 3] = 255
 
     out = OUTPUT_DIR / "parallax_concert_sky.png"
-    img.save(out)
+    img = Image.fromarray(arr, "RGBA")
+    img.save(out, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
     print(f"  [OK] {out.name}")
 
 
+@lru_cache(maxsize=8)
+def _amp_grille_mask(w, h, phase):
+    """1-bit mask of an amp cab's grille dots over a w x h field.
+
+    Dots sit on even offsets and are lit where their absolute (gx + gy) is a
+    multiple of 4, so the pattern depends on phase = (x + y) % 4 of the
+    field's corner.
+    """
+    gy, gx = np.mgrid[0:h, 0:w]
+    dot = (gx % 2 == 0) & (gy % 2 == 0) & ((gx + gy + phase) % 4 == 0)
+    return Image.fromarray(dot).convert("1")
+
+
+@lru_cache(maxsize=8)
+def _dot_grid_mask(w, h, step_x, step_y):
+    """1-bit mask of a w x h grid with a dot every step_x columns and step_y rows."""
+    gy, gx = np.mgrid[0:h, 0:w]
+    return Image.fromarray((gx % step_x == 0) & (gy % step_y == 0)).convert("1")
+
+
 def draw_amp_stack(d, x, y, w=40, h=60):
     """Draw a Marshall-style amp stack."""
     # Cabinet body
@@ -217,21 +267,17 @@ def draw_amp_stack(d, x, y, w=40, h=60):
     head_h = h // 4
     d.rectangle([x + 1, y + 1, x + w - 1, y + head_h], fill=AMP_DARK)
     # Gold logo on head
-    for lx in range(x + 6, x + w - 6, 2):
-        d.point([lx, y + head_h // 2], fill=AMP_GOLD)
+    d.point([(lx, y + head_h // 2) for lx in range(x + 6, x + w - 6, 2)], fill=AMP_GOLD)
     # Knobs on head
-    for kx in range(x + 4, x + w - 4, 5):
-        d.point([kx, y + head_h - 3], fill=AMP_CHROME)
+    d.point([(kx, y + head_h - 3) for kx in range(x + 4, x + w - 4, 5)], fill=AMP_CHROME)
 
     # Speaker cab below head
     cab_y = y + head_h + 2
     cab_h = h - head_h - 4
     d.rectangle([x + 2, cab_y, x + w - 2, y + h - 2], fill=AMP_BLACK)
     # Grille pattern
-    for gy in range(cab_y + 2, y + h - 4, 2):
-        for gx in range(x + 4, x + w - 4, 2):
-            if (gx + gy) % 4 == 0:
-                d.point([gx, gy], fill=AMP_GRILLE)
+    gx, gy = x + 4, cab_y + 2
+    d.bitmap((gx, gy), _amp_grille_mask(w - 8, y + h - 4 - gy, (gx + gy) % 4), fill=AMP_GRILLE)
 
     # Speaker cone hints
     for cone_y in [cab_y + cab_h // 4, cab_y + 3 * cab_h // 4]:
@@ -249,9 +295,7 @@ def draw_pa_speaker(d, x, y, w=25, h=18):
     """Draw a hanging PA speaker box."""
     d.rectangle([x, y, x + w, y + h], fill=PA_BLACK, outline=PA_GRILLE)
     # Grille
-    for gy in range(y + 2, y + h - 2, 2):
-        for gx in range(x + 2, x + w - 2, 3):
-            d.point([gx, gy], fill=PA_GRILLE)
+    d.bitmap((x + 2, y + 2), _dot_grid_mask(w - 4, h - 4, 3, 2), fill=PA_GRILLE)
     # Rigging point at top
     d.rectangle([x + w // 2 - 1, y - 3, x + w // 2 + 1, y], fill=SCAFFOLD_GRAY)
 
@@ -328,7 +372,7 @@ def create_mid_layer():
         draw_pa_speaker(d, px, py)
 
     out = OUTPUT_DIR / "parallax_concert_mid.png"
-    img.save(out)
+    img.save(out, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
     print(f"  [OK] {out.name}")
 
 
@@ -345,16 +389,15 @@ def create_near_layer():
     for y in range(ground_y, H, 8):
         d.line([0, y, W - 1, y], fill=(50, 35, 20, 255))
     # Wood grain
-    for _ in range(80):
-        gx = random.randint(0, W - 1)
-        gy = random.randint(ground_y, H - 1)
-        length = random.randint(8, 30)
+    gxs = RNG.integers(0, W - 1, 80, endpoint=True)
+    gys = RNG.integers(ground_y, H - 1, 80, endpoint=True)
+    lengths = RNG.integers(8, 30, 80, endpoint=True)
+    for gx, gy, length in zip(gxs.tolist(), gys.tolist(), lengths.tolist()):
         d.line([gx, gy, gx + length, gy], fill=STAGE_GRAIN)
     # Highlights
-    for _ in range(40):
-        hx = random.randint(0, W - 1)
-        hy = random.randint(ground_y, H - 1)
-        img.putpixel((hx, hy), (*STAGE_WOOD_LIGHT, 255))
+    hxs = RNG.integers(0, W - 1, 40, endpoint=True)
+    hys = RNG.integers(ground_y, H - 1, 40, endpoint=True)
+    d.point(list(zip(hxs.tolist(), hys.tolist())), fill=STAGE_WOOD_LIGHT)
 
     # ── Floor monitor wedges ──
     monitor_positions = [60, 200, 380, 520]
@@ -365,9 +408,7 @@ def create_near_layer():
         d.polygon([(mx, my + mh), (mx + 4, my), (mx + mw - 4, my), (mx + mw, my + mh)],
                   fill=MONITOR_BLACK, outline=MONITOR_GRILLE)
         # Grille on angled face
-        for gy in range(my + 2, my + mh - 2, 2):
-            for gx in range(mx + 5, mx + mw - 5, 3):
-                d.point([gx, gy], fill=MONITOR_GRILLE)
+        d.bitmap((mx + 5, my + 2), _dot_grid_mask(mw - 10, mh - 4, 3, 2), fill=MONITOR_GRILLE)
         # Chrome handle
         d.line([mx + 8, my + 1, mx + mw - 8, my + 1], fill=MONITOR_CHROME)
 
@@ -377,8 +418,10 @@ def create_near_layer():
         [(300, ground_y + 20), (400, ground_y + 18), (500, ground_y + 22), (W, ground_y + 16)],
         [(180, ground_y + 25), (250, ground_y + 30), (350, ground_y + 28), (420, ground_y + 32)],
     ]
-    for path in cable_paths:
-        cable_color = random.choice([CABLE_BLACK, CABLE_DARK, (20, 15, 12)])
+    cable_colors = [CABLE_BLACK, CABLE_DARK, (20, 15, 12)]
+    picks = RNG.integers(0, len(cable_colors), len(cable_paths))
+    for path, pick in zip(cable_paths, picks.tolist()):
+        cable_color = cable_colors[pick]
         for i in range(len(path) - 1):
             x1, y1 = path[i]
             x2, y2 = path[i + 1]
@@ -389,27 +432,30 @@ def create_near_layer():
 
     # ── Pyro flame pots ──
     pyro_positions = [100, 300, 500]
+    flame_colors = [PYRO_FLAME_1, PYRO_FLAME_2, PYRO_FLAME_3]
     for px in pyro_positions:
         py = ground_y - 5
         # Pot base
         d.rectangle([px - 5, py, px + 5, py + 6], fill=PYRO_BASE)
         d.rectangle([px - 6, py + 6, px + 6, py + 8], fill=PYRO_BASE)
         # Flame (randomized tongues)
-        for _ in range(5):
-            fx = px + random.randint(-4, 4)
-            flame_h = random.randint(8, 22)
-            fy = py - flame_h
-            flame_c = random.choice([PYRO_FLAME_1, PYRO_FLAME_2, PYRO_FLAME_3])
-            d.line([fx, py, fx, fy], fill=flame_c, width=2)
+        fxs = px + RNG.integers(-4, 4, 5, endpoint=True)
+        fys = py - RNG.integers(8, 22, 5, endpoint=True)
+        picks = RNG.integers(0, len(flame_colors), 5)
+        tip_dxs = RNG.integers(-2, 2, 5, endpoint=True)
+        for fx, fy, pick, tip_dx in zip(fxs.tolist(), fys.tolist(), picks.tolist(), tip_dxs.tolist()):
+            d.line([fx, py, fx, fy], fill=flame_colors[pick], width=2)
             # Flame tip (thinner)
-            d.line([fx, fy, fx + random.randint(-2, 2), fy - 4], fill=PYRO_FLAME_1, width=1)
-        # Glow on ground
-        for gx in range(px - 8, px + 9):
-            if 0 <= gx < W:
-                for gy in range(py + 8, min(py + 14, H)):
-                    r0, g0, b0, a0 = img.getpixel((gx, gy))
-                    if a0 > 0:
-                        img.putpixel((gx, gy), (min(r0 + 30, 255), min(g0 + 15, 255), b0, a0))
+            d.line([fx, fy, fx + tip_dx, fy - 4], fill=PYRO_FLAME_1, width=1)
+    # Glow on ground: warm up the drawn pixels under every pot in one pass
+    # over the floor band below the pot bases
+    box = (0, ground_y + 3, W, min(ground_y + 9, H))
+    band = np.array(img.crop(box))
+    for px in pyro_positions:
+        glow = band[:, max(px - 8, 0):px + 9]
+        drawn = glow[..., 3] > 0
+        glow[drawn, :2] = np.minimum(glow[drawn, :2] + PYRO_GLOW_ADD, 255)
+    img.paste(Image.fromarray(band, "RGBA"), box)
 
     # ── Mic stand (center stage) ──
     mic_x = W // 2 + 20
@@ -428,23 +474,19 @@ def create_near_layer():
     d.ellipse([mic_x - 4, mic_top_y - 10, mic_x + 4, mic_top_y - 2], fill=MIC_BLACK)
     d.ellipse([mic_x - 3, mic_top_y - 9, mic_x + 3, mic_top_y - 3],
               outline=MIC_CHROME)
-    # Cable drooping from mic
-    for i in range(15):
-        t = i / 15
-        cx = mic_x + int(8 * math.sin(t * math.pi))
-        cy = mic_top_y + int(i * 2)
-        if 0 <= cx < W and 0 <= cy < H:
-            d.point([cx, cy], fill=CABLE_BLACK)
+    # Cable drooping from mic (d.point clips to the layer itself)
+    d.point([(mic_x + int(8 * math.sin(i / 15 * math.pi)), mic_top_y + i * 2) for i in range(15)],
+            fill=CABLE_BLACK)
 
     # ── Gaffer tape marks on stage ──
-    for _ in range(4):
-        tx = random.randint(50, W - 50)
-        ty = random.randint(ground_y + 5, H - 10)
-        tw = random.randint(15, 40)
+    txs = RNG.integers(50, W - 50, 4, endpoint=True)
+    tys = RNG.integers(ground_y + 5, H - 10, 4, endpoint=True)
+    tws = RNG.integers(15, 40, 4, endpoint=True)
+    for tx, ty, tw in zip(txs.tolist(), tys.tolist(), tws.tolist()):
         d.rectangle([tx, ty, tx + tw, ty + 1], fill=(160, 160, 165, 200))
 
     out = OUTPUT_DIR / "parallax_concert_near.png"
-    img.save(out)
+    img.save(out, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
     print(f"  [OK] {out.name}")
 
 
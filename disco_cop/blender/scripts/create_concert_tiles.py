@@ -13,16 +13,21 @@ Usage:
     python create_concert_tiles.py
 """
 
-import random
+import os
 from pathlib import Path
+
+import numpy as np
 from PIL import Image, ImageDraw
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 OUTPUT_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "environment"
 
+# Fast zlib level while iterating on art; set DISCO_RELEASE_ASSETS=1 to ship.
+PNG_COMPRESS_LEVEL = 9 if os.environ.get("DISCO_RELEASE_ASSETS") else 1
+
 TILE = 32
-random.seed(404)
+RNG = np.random.default_rng(404)
 
 # Concert palette
 STAGE_DARK = (60, 40, 25)
@@ -54,10 +59,21 @@ LED_AMBER = (255, 180, 40)
 LED_AMBER_DIM = (180, 120, 20)
 VOID_BLACK = (8, 5, 10)
 
+# Amber LED strip, one tile wide: columns alternate in pairs between lit
+# (amber, amber, dim) and unlit (dim, black, black), top to bottom
+_LED_LIT = np.array([(*LED_AMBER, 255), (*LED_AMBER, 255), (*LED_AMBER_DIM, 255)], dtype=np.uint8)
+_LED_UNLIT = np.array([(*LED_AMBER_DIM, 255), (*AMP_BLACK, 255), (*AMP_BLACK, 255)], dtype=np.uint8)
+LED_STRIP = Image.fromarray(
+    np.where((np.arange(TILE) % 4 < 2)[None, :, None], _LED_LIT[:, None], _LED_UNLIT[:, None]),
+    "RGBA")
+
+# Backstage concrete speck colours, as RGBA rows for fancy-indexed writes
+CONCRETE_SPECKS = np.array([(*c, 255) for c in (CONCRETE_LIGHT, CONCRETE_DARK, CONCRETE_BASE)],
+                           dtype=np.uint8)
 
-def draw_stage_floor(img, x_off, variant=False):
+
+def draw_stage_floor(d, img, x_off, variant=False):
     """Dark wood plank stage floor."""
-    d = ImageDraw.Draw(img)
     base = STAGE_LIGHT_WOOD if variant else STAGE_DARK
     mid = STAGE_MID if not variant else (100, 70, 45)
 
@@ -68,67 +84,67 @@ def draw_stage_floor(img, x_off, variant=False):
         d.line([x_off, y, x_off + TILE - 1, y], fill=STAGE_GAP)
 
     # Wood grain
-    for y in range(TILE):
-        if random.random() < 0.25:
-            length = random.randint(6, 22)
-            sx = x_off + random.randint(0, TILE - length)
-            d.line([sx, y, sx + length, y], fill=STAGE_GRAIN)
-
-    # Plank highlights
-    for y_start in [0, 8, 16, 24]:
-        for x in range(x_off, x_off + TILE):
-            if random.random() < 0.15:
-                img.putpixel((x, y_start + 1), (*mid, 255))
+    grain_ys = np.flatnonzero(RNG.random(TILE) < 0.25)
+    lengths = RNG.integers(6, 22, grain_ys.size, endpoint=True)
+    sxs = x_off + RNG.integers(0, TILE - lengths, endpoint=True)
+    for y, sx, length in zip(grain_ys.tolist(), sxs.tolist(), lengths.tolist()):
+        d.line([sx, y, sx + length, y], fill=STAGE_GRAIN)
+
+    # Plank highlights (row below each plank's top edge)
+    rows = [1, 9, 17, 25]
+    hits = RNG.random((len(rows), TILE)) < 0.15
+    box = (x_off, 0, x_off + TILE, TILE)
+    px = np.array(img.crop(box))
+    px[rows] = np.where(hits[..., None], (*mid, 255), px[rows])
+    img.paste(Image.fromarray(px, "RGBA"), box)
 
     # Variant: gaffer tape mark
     if variant:
-        tape_y = random.randint(10, 20)
+        tape_y = int(RNG.integers(10, 20, endpoint=True))
         d.rectangle([x_off + 4, tape_y, x_off + TILE - 4, tape_y + 2], fill=GAFFER_TAPE)
         d.rectangle([x_off + 5, tape_y, x_off + TILE - 5, tape_y + 1], fill=GAFFER_TAPE_DARK)
 
     # Scuff marks
-    for _ in range(2):
-        sx = x_off + random.randint(2, TILE - 4)
-        sy = random.randint(2, TILE - 4)
-        d.point([sx, sy], fill=STAGE_LIGHT)
+    scuff_xs = x_off + RNG.integers(2, TILE - 4, 2, endpoint=True)
+    scuff_ys = RNG.integers(2, TILE - 4, 2, endpoint=True)
+    d.point(list(zip(scuff_xs.tolist(), scuff_ys.tolist())), fill=STAGE_LIGHT)
 
 
-def draw_backstage_concrete(img, x_off):
+def draw_backstage_concrete(d, img, x_off):
     """Gray backstage concrete with cracks and scuffs."""
-    d = ImageDraw.Draw(img)
     d.rectangle([x_off, 0, x_off + TILE - 1, TILE - 1], fill=CONCRETE_BASE)
 
     # Subtle texture
-    for _ in range(35):
-        x = x_off + random.randint(0, TILE - 1)
-        y = random.randint(0, TILE - 1)
-        c = random.choice([CONCRETE_LIGHT, CONCRETE_DARK, CONCRETE_BASE])
-        img.putpixel((x, y), (*c, 255))
+    xs, ys = RNG.integers(0, TILE, (2, 35))
+    box = (x_off, 0, x_off + TILE, TILE)
+    px = np.array(img.crop(box))
+    px[ys, xs] = CONCRETE_SPECKS[RNG.integers(0, len(CONCRETE_SPECKS), 35)]
+    img.paste(Image.fromarray(px, "RGBA"), box)
 
     # Expansion joint
     d.line([x_off + 16, 0, x_off + 16, TILE - 1], fill=CONCRETE_CRACK)
 
-    # Random cracks
-    for _ in range(2):
-        cx = x_off + random.randint(4, 28)
-        cy = random.randint(4, 28)
-        crack_len = random.randint(4, 8)
-        for i in range(crack_len):
-            dx = random.randint(-1, 1)
-            px = min(max(cx + dx, x_off), x_off + TILE - 1)
-            py = min(cy + i, TILE - 1)
-            d.point([px, py], fill=CONCRETE_CRACK)
+    # Random cracks (1px wobble running down from each start point)
+    cxs = x_off + RNG.integers(4, 28, 2, endpoint=True)
+    cys = RNG.integers(4, 28, 2, endpoint=True)
+    crack_lens = RNG.integers(4, 8, 2, endpoint=True)
+    cracks = []
+    for cx, cy, crack_len in zip(cxs, cys, crack_lens):
+        xs = np.clip(cx + RNG.integers(-1, 1, crack_len, endpoint=True), x_off, x_off + TILE - 1)
+        ys = np.minimum(cy + np.arange(crack_len), TILE - 1)
+        cracks += zip(xs.tolist(), ys.tolist())
+    d.point(cracks, fill=CONCRETE_CRACK)
 
     # Scuff marks (dark streaks)
-    for _ in range(3):
-        sx = x_off + random.randint(2, TILE - 6)
-        sy = random.randint(2, TILE - 2)
-        d.line([sx, sy, sx + random.randint(2, 5), sy], fill=CONCRETE_DARK)
+    scuff_xs = x_off + RNG.integers(2, TILE - 6, 3, endpoint=True)
+    scuff_ys = RNG.integers(2, TILE - 2, 3, endpoint=True)
+    lengths = RNG.integers(2, 5, 3, endpoint=True)
+    for sx, sy, length in zip(scuff_xs.tolist(), scuff_ys.tolist(), lengths.tolist()):
+        d.line([sx, sy, sx + length, sy], fill=CONCRETE_DARK)
 
 
-def draw_amp_wall(img, x_off):
+def draw_amp_wall(d, x_off):
     """Amp wall: black cabinet, speaker grille, gold logo, chrome."""
-    d = ImageDraw.Draw(img)
     d.rectangle([x_off, 0, x_off + TILE - 1, TILE - 1], fill=AMP_BLACK)
 
     # Cabinet border
@@ -136,15 +152,13 @@ def draw_amp_wall(img, x_off):
 
     # Gold logo strip at top
     d.rectangle([x_off + 4, 2, x_off + TILE - 4, 5], fill=AMP_DARK)
-    for lx in range(x_off + 6, x_off + TILE - 6, 2):
-        d.point([lx, 3], fill=AMP_GOLD)
-        d.point([lx, 4], fill=AMP_GOLD)
+    d.point([(lx, ly) for lx in range(x_off + 6, x_off + TILE - 6, 2) for ly in (3, 4)],
+            fill=AMP_GOLD)
 
-    # Speaker grille (dot pattern)
-    for gy in range(8, TILE - 4, 2):
-        for gx in range(x_off + 3, x_off + TILE - 3, 2):
-            c = AMP_GRILLE if (gx + gy) % 4 == 0 else AMP_GRILLE_LIGHT
-            d.point([gx, gy], fill=c)
+    # Speaker grille (dot pattern, two alternating shades)
+    dots = [(gx, gy) for gy in range(8, TILE - 4, 2) for gx in range(x_off + 3, x_off + TILE - 3, 2)]
+    d.point([p for p in dots if sum(p) % 4 == 0], fill=AMP_GRILLE)
+    d.point([p for p in dots if sum(p) % 4 != 0], fill=AMP_GRILLE_LIGHT)
 
     # Speaker cone hints (2 circles)
     for cy in [14, 24]:
@@ -159,46 +173,45 @@ def draw_amp_wall(img, x_off):
         d.rectangle([corner_x, corner_y, corner_x + 1, corner_y + 1], fill=AMP_CHROME)
 
 
-def draw_crowd_area(img, x_off):
+def draw_crowd_area(d, img, x_off):
     """Very dark crowd area with silhouette hints and phone screen dots."""
-    d = ImageDraw.Draw(img)
     d.rectangle([x_off, 0, x_off + TILE - 1, TILE - 1], fill=CROWD_DARK)
 
     # Head silhouettes (rounded bumps along top)
-    for hx in range(x_off + 3, x_off + TILE - 3, 6):
-        hy = random.randint(2, 8)
+    hxs = range(x_off + 3, x_off + TILE - 3, 6)
+    hys = RNG.integers(2, 8, len(hxs), endpoint=True)
+    for hx, hy in zip(hxs, hys.tolist()):
         d.ellipse([hx - 2, hy, hx + 2, hy + 4], fill=CROWD_SILHOUETTE)
         # Shoulder hints
         d.rectangle([hx - 3, hy + 4, hx + 3, hy + 8], fill=CROWD_HEAD)
 
     # Raised arm silhouettes
-    for _ in range(2):
-        ax = x_off + random.randint(4, TILE - 4)
-        ay = random.randint(0, 6)
+    axs = x_off + RNG.integers(4, TILE - 4, 2, endpoint=True)
+    ays = RNG.integers(0, 6, 2, endpoint=True)
+    for ax, ay in zip(axs.tolist(), ays.tolist()):
         d.line([ax, ay + 6, ax, ay], fill=CROWD_SILHOUETTE, width=1)
 
     # Phone screen glow dots (small bright rectangles)
-    for _ in range(3):
-        px = x_off + random.randint(2, TILE - 4)
-        py = random.randint(4, 16)
-        glow = random.choice([PHONE_GLOW, PHONE_GLOW2])
+    pxs = x_off + RNG.integers(2, TILE - 4, 3, endpoint=True)
+    pys = RNG.integers(4, 16, 3, endpoint=True)
+    glows = RNG.integers(0, 2, 3)
+    for px, py, g in zip(pxs.tolist(), pys.tolist(), glows.tolist()):
+        glow = (PHONE_GLOW, PHONE_GLOW2)[g]
         d.rectangle([px, py, px + 1, py + 2], fill=glow)
 
-    # Dark gradient toward bottom
-    for y in range(TILE // 2, TILE):
-        for x in range(x_off, x_off + TILE):
-            r0, g0, b0, a0 = img.getpixel((x, y))
-            if a0 > 0:
-                darken = (y - TILE // 2) / (TILE // 2) * 0.5
-                nr = max(int(r0 * (1 - darken)), 0)
-                ng = max(int(g0 * (1 - darken)), 0)
-                nb = max(int(b0 * (1 - darken)), 0)
-                img.putpixel((x, y), (nr, ng, nb, 255))
+    # Dark gradient toward bottom: scale drawn pixels by a per-row factor
+    half = TILE // 2
+    box = (x_off, half, x_off + TILE, TILE)
+    px = np.array(img.crop(box))
+    keep = 1 - np.arange(half) / half * 0.5
+    ys, xs = np.nonzero(px[..., 3])
+    px[ys, xs, :3] = px[ys, xs, :3] * keep[ys, None]
+    px[ys, xs, 3] = 255
+    img.paste(Image.fromarray(px, "RGBA"), box)
 
 
-def draw_stage_edge(img, x_off):
+def draw_stage_edge(d, img, x_off):
     """Stage edge: wood top + metal lip + amber LED strip + dark void below."""
-    d = ImageDraw.Draw(img)
 
     # Top half: stage wood floor
     d.rectangle([x_off, 0, x_off + TILE - 1, 13], fill=STAGE_DARK)
@@ -206,53 +219,47 @@ def draw_stage_edge(img, x_off):
     for y in [6]:
         d.line([x_off, y, x_off + TILE - 1, y], fill=STAGE_GAP)
     # Wood grain
-    for y in range(14):
-        if random.random() < 0.2:
-            length = random.randint(5, 16)
-            sx = x_off + random.randint(0, TILE - length)
-            d.line([sx, y, sx + length, y], fill=STAGE_GRAIN)
+    grain_ys = np.flatnonzero(RNG.random(14) < 0.2)
+    lengths = RNG.integers(5, 16, grain_ys.size, endpoint=True)
+    sxs = x_off + RNG.integers(0, TILE - lengths, endpoint=True)
+    for y, sx, length in zip(grain_ys.tolist(), sxs.tolist(), lengths.tolist()):
+        d.line([sx, y, sx + length, y], fill=STAGE_GRAIN)
 
     # Metal lip (2px strip)
     d.rectangle([x_off, 14, x_off + TILE - 1, 15], fill=METAL_LIP)
     # Metal highlight
-    for x in range(x_off, x_off + TILE):
-        if random.random() < 0.3:
-            img.putpixel((x, 14), (*METAL_LIP_LIGHT, 255))
+    hits = RNG.random(TILE) < 0.3
+    box = (x_off, 14, x_off + TILE, 15)
+    px = np.array(img.crop(box))
+    px[0, hits] = (*METAL_LIP_LIGHT, 255)
+    img.paste(Image.fromarray(px, "RGBA"), box)
 
     # Amber LED strip (3px tall)
-    for x in range(x_off, x_off + TILE):
-        if (x - x_off) % 4 < 2:
-            d.point([x, 16], fill=LED_AMBER)
-            d.point([x, 17], fill=LED_AMBER)
-            d.point([x, 18], fill=LED_AMBER_DIM)
-        else:
-            d.point([x, 16], fill=LED_AMBER_DIM)
-            d.point([x, 17], fill=AMP_BLACK)
-            d.point([x, 18], fill=AMP_BLACK)
+    img.paste(LED_STRIP, (x_off, 16))
 
     # Dark void below
     d.rectangle([x_off, 19, x_off + TILE - 1, TILE - 1], fill=VOID_BLACK)
     # Subtle structure hint in void
-    for y in range(20, TILE):
-        if random.random() < 0.1:
-            x = x_off + random.randint(0, TILE - 1)
-            d.point([x, y], fill=(15, 12, 18))
+    hint_ys = 20 + np.flatnonzero(RNG.random(TILE - 20) < 0.1)
+    hint_xs = x_off + RNG.integers(0, TILE - 1, hint_ys.size, endpoint=True)
+    d.point(list(zip(hint_xs.tolist(), hint_ys.tolist())), fill=(15, 12, 18))
 
 
 def main():
     num_tiles = 6
     width = num_tiles * TILE
     img = Image.new("RGBA", (width, TILE), (0, 0, 0, 0))
+    d = ImageDraw.Draw(img)
 
-    draw_stage_floor(img, 0 * TILE, variant=False)
-    draw_stage_floor(img, 1 * TILE, variant=True)
-    draw_backstage_concrete(img, 2 * TILE)
-    draw_amp_wall(img, 3 * TILE)
-    draw_crowd_area(img, 4 * TILE)
-    draw_stage_edge(img, 5 * TILE)
+    draw_stage_floor(d, img, 0 * TILE, variant=False)
+    draw_stage_floor(d, img, 1 * TILE, variant=True)
+    draw_backstage_concrete(d, img, 2 * TILE)
+    draw_amp_wall(d, 3 * TILE)
+    draw_crowd_area(d, img, 4 * TILE)
+    draw_stage_edge(d, img, 5 * TILE)
 
     out = OUTPUT_DIR / "tileset_concert.png"
-    img.save(out)
+    img.save(out, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
     print(f"  [OK] {out.name} ({width}x{TILE}, {num_tiles} tiles)")
 
 
@@ -13,59 +13,60 @@ Usage:
 """
 
 import random
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 from PIL import Image, ImageDraw
 
+from _remap import remap_channels, remap_select, scale
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent.parent
 ENEMY_DIR = PROJECT_ROOT / "disco_cop" / "assets" / "sprites" / "enemies"
 
 random.seed(813)
 
+# Which of the 8 mirror ball death shards are 2px wide, rolled up front in
+# the order the shatter frame used to roll them
+_SHARD_EXTEND = [random.random() > 0.5 for _ in range(8)]
+
 # ── Palette-swap remap functions ──────────────────────────────────────────────
 
 
-def remap_disco_dancer(r, g, b, a):
+def remap_disco_dancer(px):
     """Shooter → Disco Dancer: gold/white sparkle outfit, bell bottoms, dark skin."""
-    if a < 10:
-        return (r, g, b, a)
-    brightness = (r + g + b) / 3.0
-    is_gray = abs(r - g) < 20 and abs(g - b) < 20
-
-    if is_gray and brightness > 130:
-        # Light body → gold/white sparkle top
-        gold_r = min(int(r * 1.3), 255)
-        gold_g = min(int(g * 1.1), 220)
-        gold_b = max(int(b * 0.3), 30)
-        # Sparkle variation based on pixel position hash
-        sparkle = ((r * 7 + g * 13 + b * 3) % 40)
-        if sparkle < 10:
-            # Bright white sparkle highlight
-            return (min(gold_r + 30, 255), min(gold_g + 35, 255), min(gold_b + 60, 200), a)
-        return (gold_r, gold_g, gold_b, a)
-    elif is_gray and brightness > 80:
+    r, g, b, brightness, is_gray = remap_channels(px)
+    light = is_gray & (brightness > 130)
+    # Light body → gold/white sparkle top
+    gold_r, gold_g, gold_b = scale(r, 1.3), scale(g, 1.1, hi=220), scale(b, 0.3, lo=30)
+    # Sparkle variation based on pixel colour hash
+    sparkle = (r * 7 + g * 13 + b * 3) % 40 < 10
+    return remap_select(px, [
+        # Bright white sparkle highlight
+        (light & sparkle,
+         (np.minimum(gold_r + 30, 255), np.minimum(gold_g + 35, 255),
+          np.minimum(gold_b + 60, 200))),
+        (light, (gold_r, gold_g, gold_b)),
         # Mid body → white bell-bottom pants
-        return (min(int(r * 1.1) + 60, 245), min(int(g * 1.1) + 55, 240),
-                min(int(b * 1.1) + 50, 235), a)
-    elif brightness > 100 and r > g:
+        (is_gray & (brightness > 80),
+         (np.minimum(scale(r, 1.1) + 60, 245), np.minimum(scale(g, 1.1) + 55, 240),
+          np.minimum(scale(b, 1.1) + 50, 235))),
         # Warm accents → dark skin with gold highlight
-        return (min(int(r * 0.6), 120), min(int(g * 0.5), 90),
-                max(int(b * 0.4), 50), a)
-    elif brightness > 50:
+        ((brightness > 100) & (r > g),
+         (scale(r, 0.6, hi=120), scale(g, 0.5, hi=90), scale(b, 0.4, lo=50))),
         # Mid tones → dark skin tone
-        return (min(int(r * 0.7), 130), min(int(g * 0.55), 95),
-                max(int(b * 0.45), 55), a)
-    else:
-        # Dark (outlines, hair) → keep dark with slight gold tint
-        return (min(r + 12, 70), min(g + 8, 55), b, a)
+        (brightness > 50,
+         (scale(r, 0.7, hi=130), scale(g, 0.55, hi=95), scale(b, 0.45, lo=55))),
+        # Dark (outlines, hair) → keep dark with slight gold tint (default)
+    ], (np.minimum(r + 12, 70), np.minimum(g + 8, 55), b))
 
 
 def swap_explicit(mappings, remap_fn):
-    """Apply remap function to source sheets with explicit src->dst name mapping.
+    """Apply a vector remap to source sheets with explicit src->dst name mapping.
 
     mappings: list of (src_name, dst_name) tuples.
+    remap_fn: (H, W, 4) uint8 sheet -> remapped sheet of the same shape.
     """
     for src_name, dst_name in mappings:
         src_path = ENEMY_DIR / src_name
@@ -74,12 +75,7 @@ def swap_explicit(mappings, remap_fn):
             continue
 
         img = Image.open(src_path).convert("RGBA")
-        px = np.array(img)
-        h, w, _ = px.shape
-        for y in range(h):
-            for x in range(w):
-                r, g, b, a = px[y, x]
-                px[y, x] = remap_fn(int(r), int(g), int(b), int(a))
+        px = remap_fn(np.array(img))
 
         dst_path = ENEMY_DIR / dst_name
         Image.fromarray(px.astype(np.uint8), "RGBA").save(dst_path)
@@ -121,41 +117,8 @@ MIRROR_CRACK = (80, 85, 95)
 # ── Floor Bouncer (26x48) ────────────────────────────────────────────────────
 
 
-def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
-    """Draw a single floor bouncer frame at given offset. 26x48."""
-    d = ImageDraw.Draw(img)
-    cx = x_off + fw // 2
-    head_y = y_off + 3
-    torso_y = y_off + 14
-    hip_y = y_off + 30
-    foot_y = y_off + fh - 4
-
-    # Pose offsets
-    if pose == "walk":
-        leg_offsets = [(-2, 2), (2, -2), (-1, 1), (1, -1)]
-        lo = leg_offsets[frame % 4]
-        arm_swing = [(-2, 2), (2, -2), (-1, 1), (1, -1)]
-        ao = arm_swing[frame % 4]
-    elif pose == "attack":
-        # Heavy overhead swing
-        lo = (0, 0)
-        swing_phase = [0, -6, -3, 4][frame % 4]
-        ao = (swing_phase, swing_phase // 2)
-    elif pose == "hurt":
-        lo = (0, 0)
-        ao = (3, -3) if frame == 0 else (-3, 3)
-    elif pose == "death":
-        collapse = min(frame, 3)
-        lo = (0, 0)
-        ao = (collapse * 2, -collapse)
-        torso_y += collapse * 3
-        hip_y += collapse * 4
-        foot_y = min(foot_y + collapse * 2, y_off + fh - 1)
-        head_y += collapse * 4
-    else:
-        lo = (0, 0)
-        ao = (0, 0)
-
+def _draw_bouncer_body(d, cx, head_y, torso_y, hip_y, wire=True):
+    """Head, neck and suit torso — everything drawn before the arms."""
     # ── Head (slightly blocky — clean cut) ──
     head_w, head_h = 9, 10
     d.ellipse([cx - head_w // 2, head_y, cx + head_w // 2, head_y + head_h],
@@ -172,7 +135,7 @@ def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
     d.point([cx + head_w // 2, head_y + 4], fill=BOUNCER_EARPIECE)
     d.point([cx + head_w // 2, head_y + 5], fill=BOUNCER_EARPIECE)
     # Earpiece wire down neck
-    if pose != "death" or frame < 2:
+    if wire:
         d.line([cx + head_w // 2, head_y + 5, cx + head_w // 2 - 1, head_y + head_h + 1],
                fill=BOUNCER_EARPIECE, width=1)
 
@@ -203,6 +166,62 @@ def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
     # Jacket button
     d.point([cx, torso_y + 10], fill=BOUNCER_SUIT_LIGHT)
 
+
+@lru_cache(maxsize=None)
+def _bouncer_body(fw, fh):
+    """Upright body drawn once on a blank frame.
+
+    Every pixel is opaque or untouched, so pasting it through its own alpha
+    matches drawing it in place.
+    """
+    body = Image.new("RGBA", (fw, fh), (0, 0, 0, 0))
+    _draw_bouncer_body(ImageDraw.Draw(body), fw // 2, 3, 14, 30)
+    return body
+
+
+def draw_bouncer_frame(img, x_off, y_off, fw, fh, pose="stand", frame=0):
+    """Draw a single floor bouncer frame at given offset. 26x48."""
+    d = ImageDraw.Draw(img)
+    cx = x_off + fw // 2
+    head_y = y_off + 3
+    torso_y = y_off + 14
+    hip_y = y_off + 30
+    foot_y = y_off + fh - 4
+
+    # Pose offsets
+    if pose == "walk":
+        leg_offsets = [(-2, 2), (2, -2), (-1, 1), (1, -1)]
+        lo = leg_offsets[frame % 4]
+        arm_swing = [(-2, 2), (2, -2), (-1, 1), (1, -1)]
+        ao = arm_swing[frame % 4]
+    elif pose == "attack":
+        # Heavy overhead swing
+        lo = (0, 0)
+        swing_phase = [0, -6, -3, 4][frame % 4]
+        ao = (swing_phase, swing_phase // 2)
+    elif pose == "hurt":
+        lo = (0, 0)
+        ao = (3, -3) if frame == 0 else (-3, 3)
+    elif pose == "death":
+        collapse = min(frame, 3)
+        lo = (0, 0)
+        ao = (collapse * 2, -collapse)
+        torso_y += collapse * 3
+        hip_y += collapse * 4
+        foot_y = min(foot_y + collapse * 2, y_off + fh - 1)
+        head_y += collapse * 4
+    else:
+        lo = (0, 0)
+        ao = (0, 0)
+
+    torso_w = 14
+    if pose != "death" or frame == 0:
+        # Upright frames share one body; only arms and legs change
+        body = _bouncer_body(fw, fh)
+        img.paste(body, (x_off, y_off), body)
+    else:
+        _draw_bouncer_body(d, cx, head_y, torso_y, hip_y, wire=frame < 2)
+
     # ── Arms (suit sleeves) ──
     arm_y = torso_y + 2
     arm_len = 13
@@ -325,18 +344,17 @@ def create_floor_bouncer_sheets():
 # ── Mirror Ball (24x24) ──────────────────────────────────────────────────────
 
 
-def draw_mirror_facets(d, cx, cy, radius, rotation=0):
-    """Draw faceted mirror ball surface with rotating highlights.
+# Facet shade by (fx * 7 + fy * 13 + rotation * 5) % 12
+FACET_RGBA = np.array([(*c, 255) for c in [MIRROR_HIGHLIGHT] * 2 + [MIRROR_BODY] * 3
+                       + [MIRROR_FACET_MID] * 3 + [MIRROR_FACET_DARK] * 4], dtype=np.uint8)
 
-    rotation: 0-3 shifts highlight pattern for animation.
-    """
-    # Draw base sphere
-    d.ellipse([cx - radius, cy - radius, cx + radius, cy + radius],
-              fill=MIRROR_BODY, outline=MIRROR_FACET_DARK)
 
+@lru_cache(maxsize=None)
+def _facet_offsets(radius, rotation):
+    """Facet centres relative to the ball centre, as (dx, dy) int arrays."""
+    dxs, dys = [], []
     # Facet grid — horizontal bands
     for row in range(-radius + 2, radius, 3):
-        y = cy + row
         # Width of sphere at this row (circular cross-section)
         row_dist = abs(row) / max(radius, 1)
         if row_dist > 0.9:
@@ -344,27 +362,35 @@ def draw_mirror_facets(d, cx, cy, radius, rotation=0):
         half_w = int(radius * (1.0 - row_dist * row_dist) ** 0.5)
 
         for col_off in range(-half_w + 1, half_w, 3):
-            fx = cx + col_off + ((rotation * 1) % 3)
-            fy = y
+            dx = col_off + ((rotation * 1) % 3)
             # Check bounds inside sphere
-            dx = fx - cx
-            dy = fy - cy
-            if dx * dx + dy * dy > radius * radius:
+            if dx * dx + row * row > radius * radius:
                 continue
+            dxs.append(dx)
+            dys.append(row)
+    return np.array(dxs, dtype=np.int64), np.array(dys, dtype=np.int64)
+
+
+def draw_mirror_facets(d, img, cx, cy, radius, rotation=0):
+    """Draw faceted mirror ball surface with rotating highlights.
 
-            # Facet shading based on position and rotation
-            facet_id = (fx * 7 + fy * 13 + rotation * 5) % 12
-            if facet_id < 2:
-                color = MIRROR_HIGHLIGHT
-            elif facet_id < 5:
-                color = MIRROR_BODY
-            elif facet_id < 8:
-                color = MIRROR_FACET_MID
-            else:
-                color = MIRROR_FACET_DARK
+    rotation: 0-3 shifts highlight pattern for animation.
+    """
+    # Draw base sphere
+    d.ellipse([cx - radius, cy - radius, cx + radius, cy + radius],
+              fill=MIRROR_BODY, outline=MIRROR_FACET_DARK)
 
-            # Draw small facet square
-            d.rectangle([fx - 1, fy - 1, fx + 1, fy + 1], fill=color)
+    # 3x3 facet squares tile the grid without overlapping, so they are all
+    # written into the ball's region in one store
+    dxs, dys = _facet_offsets(radius, rotation)
+    fxs, fys = cx + dxs, cy + dys
+    colors = FACET_RGBA[(fxs * 7 + fys * 13 + rotation * 5) % 12]
+    box = (cx - radius - 2, cy - radius - 2, cx + radius + 3, cy + radius + 3)
+    px = np.array(img.crop(box))
+    oy, ox = np.mgrid[-1:2, -1:2]
+    px[(fys - box[1])[:, None, None] + oy,
+       (fxs - box[0])[:, None, None] + ox] = colors[:, None, None]
+    img.paste(Image.fromarray(px, "RGBA"), box)
 
     # Specular highlight (shifts with rotation)
     spec_x = cx - 2 + (rotation % 3)
@@ -383,6 +409,43 @@ def draw_mirror_chain(d, cx, top_y, length=4):
             d.rectangle([cx, link_y, cx + 1, link_y + 1], fill=MIRROR_CHAIN_LIGHT)
 
 
+@lru_cache(maxsize=None)
+def _mirror_ball(fw, fh, chain_len, rotation):
+    """Chain and faceted ball drawn once on a blank frame.
+
+    Facet shades hash absolute coordinates mod 12, so the cached frame is
+    valid at any offset that is a multiple of 12 (every sheet frame here).
+    """
+    ball = Image.new("RGBA", (fw, fh), (0, 0, 0, 0))
+    d = ImageDraw.Draw(ball)
+    cx, cy = fw // 2, fh // 2 + 2
+    draw_mirror_chain(d, cx, 1, length=chain_len)
+    draw_mirror_facets(d, ball, cx, cy, 8, rotation=rotation)
+    return ball
+
+
+def paste_mirror_ball(img, x_off, y_off, fw, fh, chain_len, rotation=0):
+    """Stamp the cached chain + ball; opaque pixels only, like drawing it in place."""
+    ball = _mirror_ball(fw, fh, chain_len, rotation)
+    img.paste(ball, (x_off, y_off), ball)
+
+
+@lru_cache(maxsize=None)
+def _beam_offsets(radius, frame):
+    """Attack beam endpoints relative to the ball centre, as (dx1, dy1, dx2, dy2) rows.
+
+    Offsets stay float: the longer beams run off the top of the sheet,
+    where int() truncation of the absolute coordinate matters.
+    """
+    beam_count = 4 + frame * 2  # More beams as attack progresses
+    beam_len = 3 + frame * 2
+    angle = (np.arange(beam_count) * 2 * np.pi / beam_count) + (frame * 0.3)
+    cos, sin = np.cos(angle), np.sin(angle)
+    ends = [(radius + 1) * cos, (radius + 1) * sin,
+            (radius + beam_len) * cos, (radius + beam_len) * sin]
+    return np.array(ends).T.tolist()
+
+
 def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
     """Draw a single mirror ball frame at given offset. 24x24."""
     d = ImageDraw.Draw(img)
@@ -392,8 +455,7 @@ def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
 
     if pose == "walk":
         # Spinning rotation — facets shift each frame
-        draw_mirror_chain(d, cx, y_off + 1, length=3)
-        draw_mirror_facets(d, cx, cy, radius, rotation=frame)
+        paste_mirror_ball(img, x_off, y_off, fw, fh, 3, rotation=frame)
 
         # Gentle bob up/down
         bob = [0, -1, 0, 1][frame % 4]
@@ -404,21 +466,13 @@ def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
 
     elif pose == "attack":
         # Light burst — radial beams emanate outward
-        draw_mirror_chain(d, cx, y_off + 1, length=3)
-        draw_mirror_facets(d, cx, cy, radius, rotation=frame)
+        paste_mirror_ball(img, x_off, y_off, fw, fh, 3, rotation=frame)
 
         # Light beams radiating outward
-        beam_count = 4 + frame * 2  # More beams as attack progresses
-        beam_len = 3 + frame * 2
-        import math
-        for i in range(beam_count):
-            angle = (i * 2 * math.pi / beam_count) + (frame * 0.3)
-            bx1 = int(cx + (radius + 1) * math.cos(angle))
-            by1 = int(cy + (radius + 1) * math.sin(angle))
-            bx2 = int(cx + (radius + beam_len) * math.cos(angle))
-            by2 = int(cy + (radius + beam_len) * math.sin(angle))
+        for i, (dx1, dy1, dx2, dy2) in enumerate(_beam_offsets(radius, frame)):
             beam_color = MIRROR_BEAM if i % 2 == 0 else MIRROR_BEAM_WHITE
-            d.line([bx1, by1, bx2, by2], fill=beam_color, width=1)
+            d.line([int(cx + dx1), int(cy + dy1), int(cx + dx2), int(cy + dy2)],
+                   fill=beam_color, width=1)
 
         # Bright flash halo on frames 2-3
         if frame >= 2:
@@ -427,8 +481,7 @@ def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
                   0, 360, fill=MIRROR_BEAM, width=1)
 
     elif pose == "hurt":
-        draw_mirror_chain(d, cx, y_off + 1, length=3)
-        draw_mirror_facets(d, cx, cy, radius, rotation=0)
+        paste_mirror_ball(img, x_off, y_off, fw, fh, 3)
 
         # Hurt flash overlay
         flash_alpha = 140 if frame == 0 else 70
@@ -445,17 +498,15 @@ def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
         # Shatter into fragments
         if frame == 0:
             # Still intact but cracking
-            draw_mirror_chain(d, cx, y_off + 1, length=3)
-            draw_mirror_facets(d, cx, cy, radius, rotation=0)
+            paste_mirror_ball(img, x_off, y_off, fw, fh, 3)
             # Crack lines
             d.line([cx - 3, cy - 4, cx + 4, cy + 3], fill=MIRROR_CRACK, width=1)
             d.line([cx + 2, cy - 5, cx - 3, cy + 4], fill=MIRROR_CRACK, width=1)
 
         elif frame == 1:
             # Cracking more, pieces starting to separate
-            draw_mirror_chain(d, cx, y_off + 1, length=2)  # Chain shortening
-            # Draw fragmented sphere with gaps
-            draw_mirror_facets(d, cx, cy, radius, rotation=1)
+            # Chain shortening; fragmented sphere with gaps
+            paste_mirror_ball(img, x_off, y_off, fw, fh, 2, rotation=1)
             # Multiple crack lines
             d.line([cx - radius, cy, cx + radius, cy], fill=MIRROR_CRACK, width=1)
             d.line([cx, cy - radius, cx, cy + radius], fill=MIRROR_CRACK, width=1)
@@ -495,16 +546,13 @@ def draw_mirror_ball_frame(img, x_off, y_off, fw, fh, pose="spin", frame=0):
             shard_colors = [MIRROR_BODY, MIRROR_HIGHLIGHT, MIRROR_FACET_MID,
                             MIRROR_FACET_DARK, MIRROR_BODY_DARK, MIRROR_HIGHLIGHT,
                             MIRROR_FACET_MID, MIRROR_BODY]
-            for (sx, sy), sc in zip(shard_positions, shard_colors):
-                d.point([sx, sy], fill=sc)
+            for (sx, sy), sc, wide in zip(shard_positions, shard_colors, _SHARD_EXTEND):
                 # Some shards are 2px
-                if random.random() > 0.5:
-                    d.point([sx + 1, sy], fill=sc)
+                d.point([(sx, sy), (sx + 1, sy)] if wide else [sx, sy], fill=sc)
 
     else:
         # Default standing/idle
-        draw_mirror_chain(d, cx, y_off + 1, length=3)
-        draw_mirror_facets(d, cx, cy, radius, rotation=0)
+        paste_mirror_ball(img, x_off, y_off, fw, fh, 3)
 
 
 def create_mirror_ball_sheets():